@@ -7,7 +7,7 @@ Handles key-based comparison with multi-row support
 
 import pandas as pd # type: ignore
 import numpy as np # type: ignore
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -30,16 +30,20 @@ class AlignmentMethod(Enum):
     BEST_MATCH = "best_match"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ComparisonConfig:
-    """Configuration for comparison operation"""
-    key_columns: List[str]
+    """Configuration for comparison operation (immutable and hashable)"""
+    key_columns: Sequence[str]
     alignment_method: AlignmentMethod = AlignmentMethod.POSITION
     secondary_sort_column: Optional[str] = None
     case_sensitive: bool = False
     trim_whitespace: bool = True
     compare_formulas: bool = False  # Post-MVP
    
+    def __post_init__(self):
+        # Store key columns as a tuple so a list argument still hashes
+        object.__setattr__(self, 'key_columns', tuple(self.key_columns))
+   
 
 @dataclass
 class ComparisonResult:
@@ -86,25 +90,29 @@ class ComparisonEngine:
         keys_only_b = keys_b - keys_a
         keys_common = keys_a & keys_b
        
+        # Locate each key's rows once per file
+        groups_a = self._group_rows_by_key(df_a)
+        groups_b = self._group_rows_by_key(df_b)
+       
         # Process each key group
         aligned_rows = []
        
         # Process common keys (main comparison logic)
-        for key in sorted(keys_common):
-            key_results = self._compare_key_group(key, df_a, df_b)
+        for key in sorted(keys_common, key=self._key_sort_order):
+            key_results = self._compare_key_group(key, df_a, df_b, groups_a, groups_b)
             aligned_rows.extend(key_results)
        
         # Process keys only in A (removed keys)
-        for key in sorted(keys_only_a):
-            rows_a = self._get_rows_for_key(df_a, key)
+        for key in sorted(keys_only_a, key=self._key_sort_order):
+            rows_a = self._get_rows_for_key(df_a, key, groups_a)
             for _, row in rows_a.iterrows():
                 aligned_rows.append(self._create_aligned_row(
                     key, row, None, RowStatus.REMOVED_KEY
                 ))
        
         # Process keys only in B (new keys)
-        for key in sorted(keys_only_b):
-            rows_b = self._get_rows_for_key(df_b, key)
+        for key in sorted(keys_only_b, key=self._key_sort_order):
+            rows_b = self._get_rows_for_key(df_b, key, groups_b)
             for _, row in rows_b.iterrows():
                 aligned_rows.append(self._create_aligned_row(
                     key, None, row, RowStatus.NEW_KEY
@@ -121,8 +129,8 @@ class ComparisonEngine:
         return ComparisonResult(
             summary=summary,
             aligned_data=aligned_df,
-            key_only_in_a=sorted(list(keys_only_a)),
-            key_only_in_b=sorted(list(keys_only_b)),
+            key_only_in_a=sorted(keys_only_a, key=self._key_sort_order),
+            key_only_in_b=sorted(keys_only_b, key=self._key_sort_order),
             comparison_metadata={
                 'config': self.config,
                 'total_keys_compared': len(keys_common),
@@ -142,44 +150,146 @@ class ComparisonEngine:
     def _normalize_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply normalization rules to DataFrame"""
         if self.config.trim_whitespace:
-            for col in df.select_dtypes(include=['object']).columns:
-                df[col] = df[col].astype(str).str.strip()
+            for col in df.select_dtypes(include=['object', 'string']).columns:
+                df[col] = self._as_str(df[col]).str.strip()
        
         if not self.config.case_sensitive:
-            for col in df.select_dtypes(include=['object']).columns:
-                df[col] = df[col].astype(str).str.lower()
+            for col in df.select_dtypes(include=['object', 'string']).columns:
+                df[col] = self._as_str(df[col]).str.lower()
+       
+        # Categorical columns only need their (few) categories normalized
+        if self.config.trim_whitespace or not self.config.case_sensitive:
+            for col in df.select_dtypes(include=['category']).columns:
+                if pd.api.types.is_string_dtype(df[col].cat.categories):
+                    df[col] = self._normalize_categorical(df[col])
        
         return df
    
+    @staticmethod
+    def _as_str(col: pd.Series) -> pd.Series:
+        """Cast object columns to str; 'string' columns already are and keep pd.NA"""
+        if isinstance(col.dtype, pd.StringDtype):
+            return col
+        return col.astype(str)
+   
+    def _normalize_categorical(self, col: pd.Series) -> pd.Series:
+        """
+        Normalize the categories of a string categorical column
+        
+        Categories that collapse to the same value (e.g. 'ACC1' and 'acc1'
+        when case-insensitive) are merged, and the row codes are remapped
+        without touching the per-row values.
+        """
+        categories = col.cat.categories.astype(str)
+        if self.config.trim_whitespace:
+            categories = categories.str.strip()
+        if not self.config.case_sensitive:
+            categories = categories.str.lower()
+       
+        new_codes, uniques = pd.factorize(categories)
+        codes = col.cat.codes.to_numpy()
+        codes = np.where(codes >= 0, new_codes[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=uniques),
+            index=col.index,
+            name=col.name
+        )
+   
+    @staticmethod
+    def _key_sort_order(key: Tuple) -> Tuple:
+        """Sort key for key tuples that puts missing values last instead of raising"""
+        return tuple((True, 0) if pd.isna(value) else (False, value) for value in key)
+   
     def _get_unique_keys(self, df: pd.DataFrame) -> set:
-        """Extract unique key tuples from DataFrame"""
+        """
+        Extract unique key tuples from DataFrame
+        
+        Values come from Series.tolist(), i.e. the same scalars groupby uses to
+        label groups (Timestamp rather than np.datetime64), so every key can
+        be looked up in the map built by _group_rows_by_key().
+        """
         if len(self.config.key_columns) == 1:
-            keys = df[self.config.key_columns[0]].unique()
-            return set((k,) for k in keys)
+            keys = df[self.config.key_columns[0]].drop_duplicates()
+            return set((k,) for k in keys.tolist())
         else:
-            keys = df[self.config.key_columns].drop_duplicates()
-            return set(tuple(row) for row in keys.values)
+            keys = df[list(self.config.key_columns)].drop_duplicates()
+            return set(zip(*(keys[col].tolist() for col in self.config.key_columns)))
    
-    def _get_rows_for_key(self, df: pd.DataFrame, key: Tuple) -> pd.DataFrame:
+    def _group_rows_by_key(self, df: pd.DataFrame) -> Optional[Dict[Tuple, Any]]:
+        """
+        Map each key tuple to the positions of its rows
+        
+        Key columns are factorized once per DataFrame instead of scanning the
+        whole DataFrame for every key. When the DataFrame is already indexed
+        and sorted by the key columns (e.g. set_index(keys, drop=False)
+        followed by sort_index()), each key group is a contiguous run of that
+        index and no factorization is needed.
+        """
+        key_cols = list(self.config.key_columns)
+        if not key_cols or df.empty:
+            return None
+        
+        if self._is_sorted_by_keys(df, key_cols):
+            if isinstance(df.index, pd.MultiIndex):
+                codes = np.vstack(df.index.codes)
+                changed = (codes[:, 1:] != codes[:, :-1]).any(axis=0)
+            else:
+                values = df.index.to_numpy()
+                changed = values[1:] != values[:-1]
+            starts = np.flatnonzero(np.r_[True, changed])
+            ends = np.r_[starts[1:], len(df)]
+            return {
+                (key if isinstance(key, tuple) else (key,)): slice(start, end)
+                for key, start, end in zip(df.index[starts], starts, ends)
+            }
+        
+        # Missing keys (e.g. pd.NA in 'string' columns) form a group of their own
+        grouped = df.groupby([df[col] for col in key_cols], sort=False, observed=True, dropna=False)
+        return {
+            (key if isinstance(key, tuple) else (key,)): positions
+            for key, positions in grouped.indices.items()
+        }
+    
+    def _is_sorted_by_keys(self, df: pd.DataFrame, key_cols: List[str]) -> bool:
+        """Check whether the index is the (normalized) key columns in sorted order"""
+        if list(df.index.names) != key_cols or not df.index.is_monotonic_increasing:
+            return False
+        # Normalization may have rewritten key columns after the index was built
+        return all(
+            np.array_equal(df.index.get_level_values(i).to_numpy(), df[col].to_numpy())
+            for i, col in enumerate(key_cols)
+        )
+    
+    def _get_rows_for_key(
+        self,
+        df: pd.DataFrame,
+        key: Tuple,
+        groups: Optional[Dict[Tuple, Any]] = None
+    ) -> pd.DataFrame:
         """Get all rows matching a specific key"""
-        mask = pd.Series([True] * len(df))
+        if groups is not None and key in groups:
+            return df.iloc[groups[key]].copy()
+        
+        mask = np.ones(len(df), dtype=bool)
         for i, col in enumerate(self.config.key_columns):
-            mask &= (df[col] == key[i])
+            mask &= (df[col] == key[i]).to_numpy()
         return df[mask].copy()
-   
+
     def _compare_key_group(
         self,
         key: Tuple,
         df_a: pd.DataFrame,
-        df_b: pd.DataFrame
+        df_b: pd.DataFrame,
+        groups_a: Optional[Dict[Tuple, Any]] = None,
+        groups_b: Optional[Dict[Tuple, Any]] = None
     ) -> List[Dict]:
         """
         Compare all rows within a single key group
        
         This is the core logic that handles multiple rows per key
         """
-        rows_a = self._get_rows_for_key(df_a, key)
-        rows_b = self._get_rows_for_key(df_b, key)
+        rows_a = self._get_rows_for_key(df_a, key, groups_a)
+        rows_b = self._get_rows_for_key(df_b, key, groups_b)
        
         # Apply alignment method
         if self.config.alignment_method == AlignmentMethod.SECONDARY_SORT:
@@ -4,10 +4,14 @@ Creates professionally formatted Excel reports with color coding
 """
 
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
+from copy import copy
 from datetime import datetime
-from typing import Dict, Any
+from itertools import chain
+import os
+from typing import Dict, Any, BinaryIO, Iterable, Iterator, Union
 import pandas as pd
 from pathlib import Path
 
@@ -15,6 +19,13 @@ from pathlib import Path
 class ReportGenerator:
     """
     Generates formatted Excel comparison reports
+   
+    The workbook is created in openpyxl's write-only mode: rows are streamed
+    to the file with ws.append() instead of being held in memory as Cell
+    objects, so column widths and freeze panes are set before the first row
+    and styled cells are written as WriteOnlyCell. With lxml installed
+    openpyxl serializes those rows through lxml's incremental xmlfile
+    writer; without it the pure-Python fallback is used (openpyxl.LXML).
     """
    
     # Color definitions
@@ -29,46 +40,155 @@ class ReportGenerator:
         'KEY_SEPARATOR': 'E7E6E6',   # Light Gray
     }
    
-    def __init__(self, output_path: str):
+    # Static rows of the Legend sheet's color table (status, meaning)
+    LEGEND_ITEMS = (
+        ("MATCH", "Rows are identical"),
+        ("MODIFIED", "Values changed between files"),
+        ("ADDED_ROW", "Row exists only in File B (within shared key)"),
+        ("REMOVED_ROW", "Row exists only in File A (within shared key)"),
+        ("NEW_KEY", "Entire key group only in File B"),
+        ("REMOVED_KEY", "Entire key group only in File A"),
+    )
+   
+    # Aligned Diff rows converted from pandas at a time
+    CHUNK_ROWS = 10_000
+   
+    # Where the aligned rows go: styled 'Aligned Diff' sheet or a plain CSV
+    BULK_FORMATS = ('xlsx', 'csv')
+   
+    def __init__(
+        self,
+        output_path: Union[str, os.PathLike, BinaryIO],
+        bulk_format: str = 'xlsx'
+    ):
         """
         Initialize report generator
        
         Args:
-            output_path: Path where the Excel report will be saved
+            output_path: Path where the Excel report will be saved, or a
+                writable binary file-like object (e.g. io.BytesIO)
+            bulk_format: 'xlsx' writes the aligned rows into the workbook;
+                'csv' writes them unstyled to <report stem>_aligned.csv next
+                to the report and keeps only Summary, a pointer sheet and
+                Legend in the xlsx, which is far quicker for very large
+                comparisons
         """
-        self.output_path = Path(output_path)
-        self.workbook = openpyxl.Workbook()
-       
-        # Remove default sheet
-        if 'Sheet' in self.workbook.sheetnames:
-            self.workbook.remove(self.workbook['Sheet'])
+        if bulk_format not in self.BULK_FORMATS:
+            raise ValueError(
+                f"bulk_format must be one of {self.BULK_FORMATS}, got {bulk_format!r}"
+            )
+        if isinstance(output_path, (str, os.PathLike)):
+            output_path = Path(output_path)
+            # Any other suffix could make the CSV and the workbook the same file
+            if bulk_format == 'csv' and output_path.suffix.lower() != '.xlsx':
+                raise ValueError(
+                    f"bulk_format='csv' needs an .xlsx report path, got {output_path.name!r}"
+                )
+        elif bulk_format == 'csv':
+            raise ValueError("bulk_format='csv' needs a file path to place the CSV next to")
+        self.output_path = output_path
+        self.bulk_format = bulk_format
+        # Write-only workbooks start without a default sheet
+        self.workbook = openpyxl.Workbook(write_only=True)
+        # One solid fill per status/color, shared by every cell that uses it
+        self._fills = {
+            name: PatternFill(start_color=color, end_color=color, fill_type='solid')
+            for name, color in self.COLORS.items()
+        }
+        # Fonts, alignments and the cell border are likewise built once
+        self._fonts = {
+            'title': Font(size=16, bold=True),
+            'header_title': Font(size=16, bold=True, color='FFFFFF'),
+            'section': Font(size=14, bold=True),
+            'header': Font(bold=True, color='FFFFFF'),
+            'bold': Font(bold=True),
+            'note': Font(italic=True, size=9),
+        }
+        self._alignments = {
+            'header': Alignment(horizontal='center', vertical='center'),
+            'center': Alignment(horizontal='center'),
+        }
+        thin = Side(style='thin')
+        self._border = Border(left=thin, right=thin, top=thin, bottom=thin)
+        # Style arrays already registered with the workbook, see _cell()
+        self._style_cache = {}
    
     def generate_report(
         self,
         summary: Dict[str, Any],
-        aligned_data: pd.DataFrame,
+        aligned_data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
         metadata: Dict[str, Any],
         file_a_path: str,
         file_b_path: str
-    ):
+    ) -> Dict[str, Any]:
         """
         Generate complete Excel report
        
         Args:
             summary: Summary statistics dictionary
-            aligned_data: Aligned comparison DataFrame
+            aligned_data: Aligned comparison DataFrame, or an iterable of
+                DataFrame chunks sharing the same columns
             metadata: Comparison metadata
             file_a_path: Path to File A
             file_b_path: Path to File B
+           
+        Returns:
+            Dict with the saved report 'path' and the 'sheet_names' written;
+            with bulk_format='csv' also the 'aligned_data_path' of the CSV
         """
-        # Create sheets
+        # Create sheets (write-only sheets keep their creation order)
         self._create_summary_sheet(summary, file_a_path, file_b_path)
-        self._create_aligned_diff_sheet(aligned_data, metadata)
+        csv_path = None
+        if self.bulk_format == 'csv':
+            csv_path = self._write_aligned_csv(aligned_data)
+            self._create_aligned_csv_sheet(csv_path)
+        else:
+            self._create_aligned_diff_sheet(aligned_data, metadata)
         self._create_legend_sheet(metadata)
        
         # Save workbook
         self.workbook.save(self.output_path)
-        print(f"\n✅ Report generated: {self.output_path}")
+        if isinstance(self.output_path, Path):
+            print(f"\n✅ Report generated: {self.output_path}")
+       
+        report = {'path': self.output_path, 'sheet_names': self.workbook.sheetnames}
+        if csv_path is not None:
+            report['aligned_data_path'] = csv_path
+        return report
+   
+    def _cell(self, ws, value, font=None, fill=None, alignment=None, border=None):
+        """
+        Create a write-only cell with the given styles applied
+       
+        Each distinct font/fill/alignment/border combination is registered
+        with the workbook once; later cells copy the resulting style array
+        instead of re-hashing the style objects, much like an xlsxwriter
+        format created once with add_format() and reused.
+       
+        Copying the cell's _style StyleArray relies on openpyxl internals
+        (3.0/3.1) rather than its public API; test_written_cell_styles reads
+        the styles back so an openpyxl upgrade that breaks this shows up.
+        """
+        cell = WriteOnlyCell(ws)
+        key = (id(font), id(fill), id(alignment), id(border))
+        cached = self._style_cache.get(key)
+        if cached is not None:
+            cell._style = copy(cached[0])
+        else:
+            if font is not None:
+                cell.font = font
+            if fill is not None:
+                cell.fill = fill
+            if alignment is not None:
+                cell.alignment = alignment
+            if border is not None:
+                cell.border = border
+            # Keep the style objects alive so their ids stay unique
+            self._style_cache[key] = (copy(cell._style), (font, fill, alignment, border))
+       
+        # Bind the value last so dates still pick up their number format
+        cell.value = value
+        return cell
    
     def _create_summary_sheet(
         self,
@@ -77,40 +197,35 @@ class ReportGenerator:
         file_b_path: str
     ):
         """Create summary statistics sheet"""
-        ws = self.workbook.create_sheet("Summary", 0)
+        ws = self.workbook.create_sheet("Summary")
+       
+        # Column widths must be set before any row is written
+        ws.column_dimensions['A'].width = 35
+        ws.column_dimensions['B'].width = 50
        
         # Title
-        ws['A1'] = "Excel Comparison Report - Summary"
-        ws['A1'].font = Font(size=16, bold=True, color='FFFFFF')
-        ws['A1'].fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                     end_color=self.COLORS['HEADER'],
-                                     fill_type='solid')
-        ws.merge_cells('A1:B1')
+        ws.append([self._cell(ws, "Excel Comparison Report - Summary",
+                              font=self._fonts['header_title'],
+                              fill=self._fills['HEADER'])])
+        ws.merged_cells.add('A1:B1')
        
         # Timestamp
-        ws['A2'] = "Generated:"
-        ws['B2'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        ws['A2'].font = Font(bold=True)
+        ws.append([self._cell(ws, "Generated:", font=self._fonts['bold']),
+                   datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
        
         # File information
-        row = 4
-        ws[f'A{row}'] = "File A:"
-        ws[f'B{row}'] = file_a_path
-        ws[f'A{row}'].font = Font(bold=True)
-       
-        row += 1
-        ws[f'A{row}'] = "File B:"
-        ws[f'B{row}'] = file_b_path
-        ws[f'A{row}'].font = Font(bold=True)
+        ws.append([])
+        ws.append([self._cell(ws, "File A:", font=self._fonts['bold']), file_a_path])
+        ws.append([self._cell(ws, "File B:", font=self._fonts['bold']), file_b_path])
+        row = 5
        
         # Key statistics header
+        ws.append([])
+        ws.append([self._cell(ws, "Key Statistics", font=self._fonts['section'])])
         row += 2
-        ws[f'A{row}'] = "Key Statistics"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        ws.merge_cells(f'A{row}:B{row}')
+        ws.merged_cells.add(f'A{row}:B{row}')
        
         # Key statistics
-        row += 1
         key_stats = [
             ("Total Unique Keys in File A", summary.get('total_unique_keys_a', 0)),
             ("Total Unique Keys in File B", summary.get('total_unique_keys_b', 0)),
@@ -120,19 +235,16 @@ class ReportGenerator:
         ]
        
         for label, value in key_stats:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
-            ws[f'A{row}'].font = Font(bold=True)
+            ws.append([self._cell(ws, label, font=self._fonts['bold']), value])
             row += 1
        
         # Row statistics header
-        row += 1
-        ws[f'A{row}'] = "Row Statistics"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-        ws.merge_cells(f'A{row}:B{row}')
+        ws.append([])
+        ws.append([self._cell(ws, "Row Statistics", font=self._fonts['section'])])
+        row += 2
+        ws.merged_cells.add(f'A{row}:B{row}')
        
         # Row statistics
-        row += 1
         row_stats = [
             ("Total Rows Compared", summary.get('total_rows_compared', 0)),
             ("Matching Rows", summary.get('match_count', 0)),
@@ -144,47 +256,51 @@ class ReportGenerator:
         ]
        
         for label, value in row_stats:
-            ws[f'A{row}'] = label
-            ws[f'B{row}'] = value
-            ws[f'A{row}'].font = Font(bold=True)
-           
             # Color code based on status
+            fill = None
             if "Modified" in label or "Removed Rows" in label:
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['MODIFIED'],
-                                                  end_color=self.COLORS['MODIFIED'],
-                                                  fill_type='solid')
+                fill = self._fills['MODIFIED']
             elif "Added" in label:
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['ADDED_ROW'],
-                                                  end_color=self.COLORS['ADDED_ROW'],
-                                                  fill_type='solid')
+                fill = self._fills['ADDED_ROW']
             elif "Removed Keys" in label:
-                ws[f'B{row}'].fill = PatternFill(start_color=self.COLORS['REMOVED_ROW'],
-                                                  end_color=self.COLORS['REMOVED_ROW'],
-                                                  fill_type='solid')
+                fill = self._fills['REMOVED_ROW']
+            value_cell = self._cell(ws, value, fill=fill)
            
-            row += 1
-       
-        # Auto-adjust column widths
-        ws.column_dimensions['A'].width = 35
-        ws.column_dimensions['B'].width = 50
+            ws.append([self._cell(ws, label, font=self._fonts['bold']), value_cell])
+   
+    def _iter_chunks(
+        self,
+        aligned_data: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> Iterator[pd.DataFrame]:
+        """Yield aligned_data as DataFrames of at most CHUNK_ROWS rows"""
+        if isinstance(aligned_data, pd.DataFrame):
+            for start in range(0, max(len(aligned_data), 1), self.CHUNK_ROWS):
+                yield aligned_data.iloc[start:start + self.CHUNK_ROWS]
+        else:
+            for chunk in aligned_data:
+                yield from self._iter_chunks(chunk)
    
     def _create_aligned_diff_sheet(
         self,
-        aligned_data: pd.DataFrame,
+        aligned_data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
         metadata: Dict[str, Any]
     ):
-        """Create aligned diff sheet with color coding"""
+        """Create aligned diff sheet with color coding, CHUNK_ROWS rows at a time"""
         ws = self.workbook.create_sheet("Aligned Diff")
        
-        if aligned_data.empty:
-            ws['A1'] = "No differences found"
+        chunks = self._iter_chunks(aligned_data)
+        # Leading chunks may be empty (e.g. filtered or chunked readers)
+        first = next((chunk for chunk in chunks if not chunk.empty), None)
+        if first is None:
+            ws.append(["No differences found"])
             return
+        columns = first.columns
        
         # Prepare data structure
         # Separate key columns, File A columns, status, File B columns
-        key_cols = [col for col in aligned_data.columns if col.startswith('key_')]
-        a_cols = [col for col in aligned_data.columns if col.startswith('A_')]
-        b_cols = [col for col in aligned_data.columns if col.startswith('B_')]
+        key_cols = [col for col in columns if col.startswith('key_')]
+        a_cols = [col for col in columns if col.startswith('A_')]
+        b_cols = [col for col in columns if col.startswith('B_')]
        
         # Create header row
         headers = []
@@ -210,180 +326,173 @@ class ReportGenerator:
             col_types.append('file_b')
        
         # Changed cells column (if exists)
-        if 'changed_cells' in aligned_data.columns:
+        if 'changed_cells' in columns:
             headers.append("CHANGED CELLS")
             col_types.append('changed')
        
+        # Column widths and frozen header must be set before any row is written
+        for col_idx in range(1, len(headers) + 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = 15
+        ws.freeze_panes = 'A2'
+       
         # Write header row
-        for col_idx, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = Font(bold=True, color='FFFFFF')
-            cell.fill = PatternFill(start_color=self.COLORS['HEADER'],
-                                    end_color=self.COLORS['HEADER'],
-                                    fill_type='solid')
-            cell.alignment = Alignment(horizontal='center', vertical='center')
+        ws.append([
+            self._cell(ws, header,
+                       font=self._fonts['header'],
+                       fill=self._fills['HEADER'],
+                       alignment=self._alignments['header'])
+            for header in headers
+        ])
        
         # Write data rows
         current_key = None
-        border_style = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-       
-        for df_row_idx, row in aligned_data.iterrows():
-            excel_row = df_row_idx + 2  # +2 because Excel is 1-indexed and we have header
-           
-            # Check if this is a new key group (for visual separation)
-            row_key = tuple(row[col] for col in key_cols)
-            is_new_key_group = (current_key != row_key)
-            current_key = row_key
-           
-            col_idx = 1
-           
-            # Write key columns
-            for col in key_cols:
-                cell = ws.cell(row=excel_row, column=col_idx, value=row[col])
-                cell.border = border_style
-                if is_new_key_group:
-                    cell.fill = PatternFill(start_color=self.COLORS['KEY_SEPARATOR'],
-                                           end_color=self.COLORS['KEY_SEPARATOR'],
-                                           fill_type='solid')
-                    cell.font = Font(bold=True)
-                col_idx += 1
-           
-            # Write File A columns
-            for col in a_cols:
-                value = row[col] if col in row and pd.notna(row[col]) else ""
-                cell = ws.cell(row=excel_row, column=col_idx, value=value)
-                cell.border = border_style
-                col_idx += 1
-           
-            # Write status
-            status = row['status']
-            cell = ws.cell(row=excel_row, column=col_idx, value=status)
-            cell.border = border_style
-            cell.alignment = Alignment(horizontal='center')
-            cell.font = Font(bold=True)
+        border_style = self._border
+       
+        # Column positions within each row of the value array
+        col_pos = {col: idx for idx, col in enumerate(columns)}
+        key_pos = [col_pos[col] for col in key_cols]
+        a_pos = [col_pos[col] for col in a_cols]
+        status_pos = col_pos['status']
+        # File B columns paired with their File A counterpart (None if absent)
+        b_pos = [(col_pos[col], col_pos.get(col.replace('B_', 'A_'))) for col in b_cols]
+        changed_pos = col_pos.get('changed_cells')
+       
+        for chunk in chain([first], chunks):
+            # Pull values and the missing-value mask out of pandas once per chunk
+            values = chunk.to_numpy(dtype=object)
+            present = chunk.notna().to_numpy()
            
-            # Color code based on status
-            if status in self.COLORS:
-                cell.fill = PatternFill(start_color=self.COLORS[status],
-                                       end_color=self.COLORS[status],
-                                       fill_type='solid')
-            col_idx += 1
-           
-            # Write File B columns
-            for col in b_cols:
-                value = row[col] if col in row and pd.notna(row[col]) else ""
-                cell = ws.cell(row=excel_row, column=col_idx, value=value)
-                cell.border = border_style
+            for row, row_present in zip(values, present):
+                row_cells = []
                
-                # Highlight modified cells
-                if status == 'MODIFIED':
-                    corresponding_a_col = col.replace('B_', 'A_')
-                    if corresponding_a_col in row:
-                        a_val = row[corresponding_a_col]
-                        b_val = value
-                        if pd.notna(a_val) and pd.notna(b_val) and a_val != b_val:
-                            cell.fill = PatternFill(start_color=self.COLORS['MODIFIED'],
-                                                   end_color=self.COLORS['MODIFIED'],
-                                                   fill_type='solid')
+                # Check if this is a new key group (for visual separation)
+                # (missing keys become None, which compares without raising on pd.NA)
+                row_key = tuple(row[pos] if row_present[pos] else None for pos in key_pos)
+                is_new_key_group = (current_key != row_key)
+                current_key = row_key
                
-                col_idx += 1
-           
-            # Write changed cells info
-            if 'changed_cells' in aligned_data.columns:
-                value = row['changed_cells'] if pd.notna(row.get('changed_cells')) else ""
-                cell = ws.cell(row=excel_row, column=col_idx, value=value)
-                cell.border = border_style
-                cell.font = Font(italic=True, size=9)
-       
-        # Auto-adjust column widths
-        for col_idx in range(1, len(headers) + 1):
-            ws.column_dimensions[get_column_letter(col_idx)].width = 15
-       
-        # Freeze header row
-        ws.freeze_panes = 'A2'
+                # Write key columns
+                for pos in key_pos:
+                    value = row[pos] if row_present[pos] else ""
+                    if is_new_key_group:
+                        cell = self._cell(ws, value,
+                                          font=self._fonts['bold'],
+                                          fill=self._fills['KEY_SEPARATOR'],
+                                          border=border_style)
+                    else:
+                        cell = self._cell(ws, value, border=border_style)
+                    row_cells.append(cell)
+               
+                # Write File A columns
+                for pos in a_pos:
+                    value = row[pos] if row_present[pos] else ""
+                    row_cells.append(self._cell(ws, value, border=border_style))
+               
+                # Write status
+                status = row[status_pos]
+                # Color code based on status
+                row_cells.append(self._cell(ws, status,
+                                            font=self._fonts['bold'],
+                                            fill=self._fills.get(status),
+                                            alignment=self._alignments['center'],
+                                            border=border_style))
+               
+                # Write File B columns
+                for pos, a_pos_for_b in b_pos:
+                    value = row[pos] if row_present[pos] else ""
+                   
+                    # Highlight modified cells
+                    fill = None
+                    if (status == 'MODIFIED' and a_pos_for_b is not None
+                            and row_present[a_pos_for_b] and row[a_pos_for_b] != value):
+                        fill = self._fills['MODIFIED']
+                   
+                    row_cells.append(self._cell(ws, value, fill=fill, border=border_style))
+               
+                # Write changed cells info
+                if changed_pos is not None:
+                    value = row[changed_pos] if row_present[changed_pos] else ""
+                    row_cells.append(self._cell(ws, value,
+                                                font=self._fonts['note'],
+                                                border=border_style))
+               
+                ws.append(row_cells)
+   
+    def _write_aligned_csv(
+        self,
+        aligned_data: Union[pd.DataFrame, Iterable[pd.DataFrame]]
+    ) -> Path:
+        """Write aligned_data, unstyled and with its own column names, beside the report"""
+        # A distinct name, so an existing <stem>.csv (e.g. an input file) is left alone
+        csv_path = self.output_path.with_name(f"{self.output_path.stem}_aligned.csv")
+        if isinstance(aligned_data, pd.DataFrame):
+            aligned_data.to_csv(csv_path, index=False)
+            return csv_path
+       
+        # Chunks are appended; only the first one writes the header row
+        with open(csv_path, 'w', newline='', encoding='utf-8') as handle:
+            for idx, chunk in enumerate(aligned_data):
+                chunk.to_csv(handle, index=False, header=(idx == 0))
+        return csv_path
+   
+    def _create_aligned_csv_sheet(self, csv_path: Path):
+        """Create the Aligned Diff sheet pointing at the CSV holding the rows"""
+        ws = self.workbook.create_sheet("Aligned Diff")
+        ws.column_dimensions['A'].width = 30
+       
+        ws.append([self._cell(ws, "Aligned data written to CSV:", font=self._fonts['bold'])])
+        # Relative link, so it keeps working while both files are moved together
+        link = self._cell(ws, csv_path.name)
+        link.hyperlink = csv_path.name
+        ws.append([link])
+        ws.append([self._cell(ws, "Rows are unstyled; see Legend for the status values.",
+                              font=self._fonts['note'])])
    
     def _create_legend_sheet(self, metadata: Dict[str, Any]):
         """Create legend/documentation sheet"""
         ws = self.workbook.create_sheet("Legend")
        
+        # Column widths must be set before any row is written
+        ws.column_dimensions['A'].width = 25
+        ws.column_dimensions['B'].width = 20
+        ws.column_dimensions['C'].width = 50
+       
         # Title
-        ws['A1'] = "Legend & Configuration"
-        ws['A1'].font = Font(size=16, bold=True)
-        ws.merge_cells('A1:C1')
+        ws.append([self._cell(ws, "Legend & Configuration", font=self._fonts['title'])])
+        ws.merged_cells.add('A1:C1')
        
         # Color legend
-        row = 3
-        ws[f'A{row}'] = "Color Legend"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
-       
-        row += 1
-        ws[f'A{row}'] = "Status"
-        ws[f'B{row}'] = "Color"
-        ws[f'C{row}'] = "Meaning"
-        for col in ['A', 'B', 'C']:
-            ws[f'{col}{row}'].font = Font(bold=True)
-       
-        row += 1
-        legend_items = [
-            ("MATCH", self.COLORS['MATCH'], "Rows are identical"),
-            ("MODIFIED", self.COLORS['MODIFIED'], "Values changed between files"),
-            ("ADDED_ROW", self.COLORS['ADDED_ROW'], "Row exists only in File B (within shared key)"),
-            ("REMOVED_ROW", self.COLORS['REMOVED_ROW'], "Row exists only in File A (within shared key)"),
-            ("NEW_KEY", self.COLORS['NEW_KEY'], "Entire key group only in File B"),
-            ("REMOVED_KEY", self.COLORS['REMOVED_KEY'], "Entire key group only in File A"),
-        ]
+        ws.append([])
+        ws.append([self._cell(ws, "Color Legend", font=self._fonts['section'])])
        
-        for status, color, meaning in legend_items:
-            ws[f'A{row}'] = status
-            ws[f'B{row}'] = ""
-            ws[f'B{row}'].fill = PatternFill(start_color=color,
-                                            end_color=color,
-                                            fill_type='solid')
-            ws[f'C{row}'] = meaning
-            row += 1
+        ws.append([self._cell(ws, header, font=self._fonts['bold'])
+                   for header in ("Status", "Color", "Meaning")])
+       
+        for status, meaning in self.LEGEND_ITEMS:
+            ws.append([
+                status,
+                self._cell(ws, "", fill=self._fills[status]),
+                meaning
+            ])
        
         # Comparison configuration
-        row += 2
-        ws[f'A{row}'] = "Comparison Configuration"
-        ws[f'A{row}'].font = Font(size=14, bold=True)
+        ws.append([])
+        ws.append([])
+        ws.append([self._cell(ws, "Comparison Configuration", font=self._fonts['section'])])
        
-        row += 1
         config = metadata.get('config')
         if config:
-            ws[f'A{row}'] = "Key Columns:"
-            ws[f'B{row}'] = ", ".join(config.key_columns)
-            ws[f'A{row}'].font = Font(bold=True)
-           
-            row += 1
-            ws[f'A{row}'] = "Alignment Method:"
-            ws[f'B{row}'] = config.alignment_method.value
-            ws[f'A{row}'].font = Font(bold=True)
-           
+            config_rows = [
+                ("Key Columns:", ", ".join(config.key_columns)),
+                ("Alignment Method:", config.alignment_method.value),
+            ]
             if config.secondary_sort_column:
-                row += 1
-                ws[f'A{row}'] = "Secondary Sort:"
-                ws[f'B{row}'] = config.secondary_sort_column
-                ws[f'A{row}'].font = Font(bold=True)
+                config_rows.append(("Secondary Sort:", config.secondary_sort_column))
+            config_rows.append(("Case Sensitive:", "Yes" if config.case_sensitive else "No"))
+            config_rows.append(("Trim Whitespace:", "Yes" if config.trim_whitespace else "No"))
            
-            row += 1
-            ws[f'A{row}'] = "Case Sensitive:"
-            ws[f'B{row}'] = "Yes" if config.case_sensitive else "No"
-            ws[f'A{row}'].font = Font(bold=True)
-           
-            row += 1
-            ws[f'A{row}'] = "Trim Whitespace:"
-            ws[f'B{row}'] = "Yes" if config.trim_whitespace else "No"
-            ws[f'A{row}'].font = Font(bold=True)
-       
-        # Auto-adjust column widths
-        ws.column_dimensions['A'].width = 25
-        ws.column_dimensions['B'].width = 20
-        ws.column_dimensions['C'].width = 50
+            for label, value in config_rows:
+                ws.append([self._cell(ws, label, font=self._fonts['bold']), value])
 
 
 # Helper function for quick report generation
@@ -393,8 +502,9 @@ def generate_comparison_report(
     aligned_data: pd.DataFrame,
     metadata: Dict[str, Any],
     file_a_path: str,
-    file_b_path: str
-):
+    file_b_path: str,
+    bulk_format: str = 'xlsx'
+) -> Dict[str, Any]:
     """
     Quick helper to generate a comparison report
    
@@ -405,9 +515,13 @@ def generate_comparison_report(
         metadata: Comparison metadata
         file_a_path: Path to File A
         file_b_path: Path to File B
+        bulk_format: 'xlsx' (default) or 'csv', see ReportGenerator
+       
+    Returns:
+        Dict with the saved report 'path' and the 'sheet_names' written
     """
-    generator = ReportGenerator(output_path)
-    generator.generate_report(
+    generator = ReportGenerator(output_path, bulk_format=bulk_format)
+    return generator.generate_report(
         summary=summary,
         aligned_data=aligned_data,
         metadata=metadata,
@@ -3,9 +3,19 @@ Conftest for pytest configuration and shared fixtures
 """
 
 import pytest
+import random
+import numpy as np
 import pandas as pd
-import tempfile
-from pathlib import Path
+
+import src.core  # noqa: F401  warm the engine import before the first test
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    @pytest.fixture
+    def benchmark():
+        """Skip benchmark tests when pytest-benchmark is not installed"""
+        pytest.skip("pytest-benchmark not installed")
 
 
 @pytest.fixture
@@ -54,36 +64,168 @@ def sample_policy_dataframe_b():
     })
 
 
+# Integration scenario frames. These are built once per module and shared;
+# ComparisonEngine.compare never mutates its inputs, so tests must not either.
+# Their key columns are categorical over the union of both files' keys, which
+# is also the cheapest layout for library users to pass in.
+
+def _with_shared_categories(df_a, df_b, *columns):
+    """Convert columns in both frames to one CategoricalDtype built from their union"""
+    for col in columns:
+        dtype = pd.CategoricalDtype(pd.concat([df_a[col], df_b[col]]).unique())
+        df_a[col] = df_a[col].astype(dtype)
+        df_b[col] = df_b[col].astype(dtype)
+    return df_a, df_b
+
+
+@pytest.fixture(scope="module")
+def policy_frames():
+    """Policy/coverage frames where one premium changed"""
+    df_a = pd.DataFrame({
+        'Policy': pd.array(['P001', 'P001', 'P002'], dtype='string'),
+        'Coverage': pd.array(['A', 'B', 'A'], dtype='string'),
+        'Premium': np.array([100, 50, 200], dtype=np.int64),
+        'Status': pd.array(['Active', 'Active', 'Pending'], dtype='string')
+    })
+    df_b = pd.DataFrame({
+        'Policy': pd.array(['P001', 'P001', 'P002'], dtype='string'),
+        'Coverage': pd.array(['A', 'B', 'A'], dtype='string'),
+        'Premium': np.array([100, 55, 200], dtype=np.int64),  # Modified
+        'Status': pd.array(['Active', 'Active', 'Pending'], dtype='string')
+    })
+    return _with_shared_categories(df_a, df_b, 'Policy')
+
+
+@pytest.fixture(scope="module")
+def employee_frames():
+    """Employee frames with added, removed, and modified rows"""
+    df_a = pd.DataFrame({
+        'ID': np.array([1, 2, 3, 4], dtype=np.int64),
+        'Name': pd.array(['Alice', 'Bob', 'Charlie', 'David'], dtype='string'),
+        'Department': pd.array(['Sales', 'IT', 'HR', 'Finance'], dtype='string'),
+        'Salary': np.array([50000, 60000, 55000, 65000], dtype=np.int64)
+    })
+    df_b = pd.DataFrame({
+        'ID': np.array([1, 2, 3, 5], dtype=np.int64),
+        'Name': pd.array(['Alice', 'Bob', 'Charles', 'Eve'], dtype='string'),  # Modified Charlie, removed David, added Eve
+        'Department': pd.array(['Sales', 'IT', 'HR', 'Operations'], dtype='string'),  # Modified HR/Ops
+        'Salary': np.array([52000, 60000, 55000, 70000], dtype=np.int64)  # Multiple salary changes
+    })
+    return _with_shared_categories(df_a, df_b, 'ID')
+
+
+@pytest.fixture(scope="module")
+def transactions_a():
+    """Account/date transactions shared by the transaction and ledger scenarios"""
+    df_a = pd.DataFrame({
+        'Account': pd.array(['ACC001', 'ACC001', 'ACC002', 'ACC002'], dtype='string'),
+        'TransDate': pd.to_datetime(['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-03']),
+        'Amount': np.array([1000.00, 500.00, 2000.00, 300.00], dtype=np.float64),
+        'Type': pd.array(['Deposit', 'Withdrawal', 'Deposit', 'Fee'], dtype='string')
+    })
+    df_a['Account'] = df_a['Account'].astype('category')
+    return df_a
+
+
+@pytest.fixture(scope="module")
+def transaction_frames(transactions_a):
+    """Account/date transaction frames where the last amount changed"""
+    last_day = transactions_a['TransDate'] == pd.Timestamp('2024-01-03')
+    df_b = transactions_a.assign(
+        Amount=transactions_a['Amount'].mask(last_day, transactions_a['Amount'] + 50)
+    )
+    return transactions_a, df_b
+
+
+@pytest.fixture(scope="module")
+def coverage_frames():
+    """Policies with several coverages; one modified and one added"""
+    df_a = pd.DataFrame({
+        'Policy': pd.array(['P001', 'P001', 'P001', 'P002', 'P002'], dtype='string'),
+        'Coverage': pd.array(['Basic', 'Standard', 'Premium', 'Basic', 'Standard'], dtype='string'),
+        'Premium': np.array([100, 150, 200, 120, 180], dtype=np.int64),
+        'Limit': np.array([100000, 250000, 500000, 100000, 250000], dtype=np.int64)
+    })
+    df_b = pd.DataFrame({
+        'Policy': pd.array(['P001', 'P001', 'P001', 'P002', 'P002', 'P002'], dtype='string'),
+        'Coverage': pd.array(['Basic', 'Standard', 'Premium', 'Basic', 'Standard', 'Elite'], dtype='string'),
+        'Premium': np.array([100, 160, 200, 120, 180, 250], dtype=np.int64),  # Modified one, added one
+        'Limit': np.array([100000, 250000, 500000, 100000, 250000, 600000], dtype=np.int64)
+    })
+    return _with_shared_categories(df_a, df_b, 'Policy')
+
+
+@pytest.fixture(scope="module")
+def insurance_frames():
+    """Insurance policy frames with one modified coverage and one new policy"""
+    df_a = pd.DataFrame({
+        'PolicyNumber': pd.array(['POL001', 'POL001', 'POL001', 'POL002'], dtype='string'),
+        'CoverageType': pd.array(['Liability', 'Property', 'Medical', 'Liability'], dtype='string'),
+        'Premium': np.array([500.00, 1000.00, 200.00, 600.00], dtype=np.float64),
+        'Limit': np.array([100000, 500000, 10000, 100000], dtype=np.int64),
+        'Effective': pd.to_datetime(['2024-01-01'] * 4)
+    })
+    df_b = pd.DataFrame({
+        'PolicyNumber': pd.array(['POL001', 'POL001', 'POL001', 'POL002', 'POL003'], dtype='string'),
+        'CoverageType': pd.array(['Liability', 'Property', 'Medical', 'Liability', 'Liability'], dtype='string'),
+        'Premium': np.array([525.00, 1000.00, 200.00, 600.00, 450.00], dtype=np.float64),  # One modified, one new
+        'Limit': np.array([100000, 500000, 10000, 100000, 75000], dtype=np.int64),
+        'Effective': pd.to_datetime(['2024-01-01'] * 5)
+    })
+    return _with_shared_categories(df_a, df_b, 'PolicyNumber')
+
+
+@pytest.fixture(scope="module")
+def ledger_frames(transactions_a):
+    """Ledger view of the shared transactions where one fee and its balance differ"""
+    df_a = transactions_a.rename(columns={'TransDate': 'Date'})
+    # Deposits add to the running balance; withdrawals and fees take from it
+    signed = df_a['Amount'].where(df_a['Type'] == 'Deposit', -df_a['Amount'])
+    df_a = df_a.assign(Balance=signed.groupby(df_a['Account'], observed=True).cumsum())
+    fee = df_a['Type'] == 'Fee'
+    df_b = df_a.assign(
+        Amount=df_a['Amount'].mask(fee, df_a['Amount'] + 5),  # Fee amount different
+        Balance=df_a['Balance'].mask(fee, df_a['Balance'] - 5)  # Balance lower by the extra fee
+    )
+    return df_a, df_b
+
+
+@pytest.fixture(scope="module")
+def people_frames():
+    """Small ID/Name/Value frames with a modified, removed, and new key"""
+    df_a = pd.DataFrame({
+        'ID': np.array([1, 2, 3], dtype=np.int64),
+        'Name': pd.array(['Alice', 'Bob', 'Charlie'], dtype='string'),
+        'Value': np.array([100, 200, 300], dtype=np.int64)
+    })
+    df_b = pd.DataFrame({
+        'ID': np.array([1, 2, 4], dtype=np.int64),
+        'Name': pd.array(['Alice', 'Robert', 'Diana'], dtype='string'),
+        'Value': np.array([100, 250, 400], dtype=np.int64)
+    })
+    return _with_shared_categories(df_a, df_b, 'ID')
+
+
 @pytest.fixture
-def temp_excel_file():
-    """Create a temporary Excel file"""
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-        temp_path = f.name
-    
-    yield temp_path
-    
-    # Cleanup
-    if Path(temp_path).exists():
-        Path(temp_path).unlink()
+def temp_excel_file(tmp_path):
+    """Path for a temporary Excel file (removed with tmp_path)"""
+    return str(tmp_path / "temp.xlsx")
 
 
 @pytest.fixture
-def temp_report_file():
-    """Create a temporary report Excel file"""
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-        temp_path = f.name
-    
-    yield temp_path
-    
-    # Cleanup
-    if Path(temp_path).exists():
-        Path(temp_path).unlink()
+def temp_report_file(tmp_path):
+    """Path for a temporary report Excel file (removed with tmp_path)"""
+    return str(tmp_path / "report.xlsx")
+
+
+@pytest.fixture(autouse=True, scope='session')
+def warm_pandas():
+    """Build a tiny DataFrame once so pandas' lazy setup isn't charged to the first test"""
+    pd.DataFrame({'a': [1]}).copy()
 
 
 @pytest.fixture(autouse=True)
 def reset_random_state():
     """Reset random state before each test"""
-    import random
-    import numpy as np
     random.seed(42)
     np.random.seed(42)
@@ -3,109 +3,200 @@ Integration tests for Excel Comparison Tool
 Tests end-to-end workflow and component interaction
 """
 
+import functools
+import io
 import pytest
 import pandas as pd
-import tempfile
-from pathlib import Path
+import numpy as np
 from datetime import datetime
-from openpyxl import load_workbook
 
 from src.core import (
     ComparisonEngine,
     ComparisonConfig,
+    ComparisonResult,
     RowStatus,
     AlignmentMethod
 )
-from src.reports.report_generator import ReportGenerator
+
+
+pytestmark = pytest.mark.integration
+
+REPORT_SHEETS = ['Summary', 'Aligned Diff', 'Legend']
+
+# (frames fixture, config, expected summary counts)
+SCENARIOS = [
+    pytest.param(
+        'policy_frames',
+        ComparisonConfig(
+            key_columns=('Policy',),
+            alignment_method=AlignmentMethod.POSITION
+        ),
+        {'keys_in_common': 2, 'modified_count': 1, 'match_count': 2},
+        id='full_workflow_basic'
+    ),
+    pytest.param(
+        'transaction_frames',
+        ComparisonConfig(
+            key_columns=('Account', 'TransDate'),
+            alignment_method=AlignmentMethod.POSITION
+        ),
+        {'keys_in_common': 4, 'modified_count': 1},
+        id='composite_key_full_workflow'
+    ),
+    pytest.param(
+        'insurance_frames',
+        ComparisonConfig(
+            key_columns=('PolicyNumber',),
+            case_sensitive=False,
+            trim_whitespace=True
+        ),
+        # POL001 has multiple coverages, POL002 matches, POL003 is new
+        {'keys_in_common': 2, 'keys_only_in_b': 1, 'new_key_count': 1, 'modified_count': 1},
+        id='insurance_policy_comparison'
+    ),
+    pytest.param(
+        'ledger_frames',
+        ComparisonConfig(
+            key_columns=('Account', 'Date'),
+            alignment_method=AlignmentMethod.POSITION
+        ),
+        # One transaction should show as modified
+        {'modified_count': 1, 'keys_in_common': 4},
+        id='financial_transaction_reconciliation'
+    ),
+    pytest.param(
+        'people_frames',
+        ComparisonConfig(key_columns=('ID',)),
+        {'keys_in_common': 2, 'match_count': 1, 'modified_count': 1},
+        id='report_contains_all_comparison_data'
+    ),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _engine_for(config):
+    """
+    Return one shared ComparisonEngine per config
+    
+    ComparisonConfig is frozen and hashable when key_columns is a tuple, and
+    compare() keeps no per-comparison state on the engine, so tests with
+    equal configs can safely reuse the same engine.
+    """
+    return ComparisonEngine(config)
+
+
+def _make_txn_frames(n_accounts, n_days, modify_fraction):
+    """
+    Build n_accounts * n_days transaction frames keyed by Account/TransDate
+    
+    Columns are generated with np.repeat/np.tile, so the same helper scales
+    from a handful of rows to stress sizes. Every round(1 / modify_fraction)-th
+    Amount in File B is changed.
+    """
+    n_rows = n_accounts * n_days
+    accounts = np.array([f'ACC{i:03d}' for i in range(1, n_accounts + 1)])
+    dates = pd.date_range('2024-01-01', periods=n_days).to_numpy()
+    types = np.array(['Deposit', 'Withdrawal', 'Fee'])
+    
+    df_a = pd.DataFrame({
+        'Account': np.repeat(accounts, n_days),
+        'TransDate': np.tile(dates, n_accounts),
+        'Amount': np.arange(100, 100 + 10 * n_rows, 10, dtype=np.float64),
+        'Type': np.resize(types, n_rows)
+    })
+    step = max(1, round(1 / modify_fraction))
+    modified = np.arange(n_rows) % step == 0
+    df_b = df_a.assign(Amount=df_a['Amount'].mask(modified, df_a['Amount'] + 50))
+    return df_a, df_b
+
+
+def _run(df_a, df_b, config, expected):
+    """Compare two frames and check the expected summary counts"""
+    result = _engine_for(config).compare(df_a, df_b)
+    
+    expected = pd.Series(expected, dtype='int64')
+    # A missing summary key shows up as NaN in the diff instead of a cast error
+    actual = pd.Series(result.summary).reindex(expected.index)
+    pd.testing.assert_series_equal(actual, expected, check_dtype=False)
+    return result
+
+
+@pytest.fixture(scope="class", params=[
+    pytest.param(('ID',), id='single_key'),
+    pytest.param(('Account', 'TransDate'), id='composite_key'),
+    pytest.param('transaction_frames', id='engine_composite_key'),
+])
+def report_result(request):
+    """
+    ComparisonResult to write a report from
+    
+    Key-column tuples give a hand-built result with one matching and one
+    modified row; a frames fixture name gives the real ComparisonEngine
+    output for that scenario (categorical Account, datetime TransDate).
+    """
+    if isinstance(request.param, str):
+        df_a, df_b = request.getfixturevalue(request.param)
+        config = ComparisonConfig(key_columns=('Account', 'TransDate'))
+        return _engine_for(config).compare(df_a, df_b)
+    
+    key_cols = request.param
+    aligned = pd.DataFrame({f'key_{col}': ['K1', 'K2'] for col in key_cols})
+    aligned['A_Value'] = [1, 2]
+    aligned['status'] = [RowStatus.MATCH.value, RowStatus.MODIFIED.value]
+    aligned['B_Value'] = [1, 3]
+    aligned['changed_cells'] = [np.nan, 'Value']
+    
+    return ComparisonResult(
+        summary={'keys_in_common': 2, 'total_rows_compared': 2,
+                 'match_count': 1, 'modified_count': 1},
+        aligned_data=aligned,
+        comparison_metadata={
+            'config': ComparisonConfig(key_columns=key_cols),
+            'total_keys_compared': 2,
+            'total_rows_a': 2,
+            'total_rows_b': 2
+        }
+    )
+
+
+@pytest.fixture(scope="class")
+def generated_report(report_result):
+    """Write one in-memory report per result and share it across the class"""
+    openpyxl = pytest.importorskip("openpyxl")
+    from src.reports.report_generator import ReportGenerator
+    
+    buffer = io.BytesIO()
+    ReportGenerator(buffer).generate_report(
+        summary=report_result.summary,
+        aligned_data=report_result.aligned_data,
+        metadata=report_result.comparison_metadata,
+        file_a_path='file_a.xlsx',
+        file_b_path='file_b.xlsx'
+    )
+    
+    buffer.seek(0)
+    wb = openpyxl.load_workbook(buffer, read_only=True, data_only=True)
+    yield wb
+    wb.close()
 
 
 class TestEndToEndComparison:
     """Test complete comparison workflow"""
     
-    def test_full_workflow_basic(self):
-        """Test complete workflow: load -> compare -> report"""
-        # Create test dataframes
-        df_a = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P002'],
-            'Coverage': ['A', 'B', 'A'],
-            'Premium': [100, 50, 200],
-            'Status': ['Active', 'Active', 'Pending']
-        })
-        
-        df_b = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P002'],
-            'Coverage': ['A', 'B', 'A'],
-            'Premium': [100, 55, 200],  # Modified
-            'Status': ['Active', 'Active', 'Pending']
-        })
-        
-        # Configure comparison
-        config = ComparisonConfig(
-            key_columns=['Policy'],
-            alignment_method=AlignmentMethod.POSITION,
-            case_sensitive=False,
-            trim_whitespace=True
-        )
-        
-        # Run comparison
-        engine = ComparisonEngine(config)
-        result = engine.compare(df_a, df_b)
-        
-        # Verify results
-        assert result.summary['keys_in_common'] == 2
-        assert result.summary['modified_count'] == 1
-        assert result.summary['match_count'] == 2
-        
-        # Generate report
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            report_path = f.name
+    @pytest.mark.parametrize('frames,config,expected', SCENARIOS)
+    def test_scenario_compare_semantics(self, request, frames, config, expected):
+        """Test load -> compare for each scenario, without any report I/O"""
+        df_a, df_b = request.getfixturevalue(frames)
         
-        try:
-            generator = ReportGenerator(report_path)
-            generator.generate_report(
-                summary=result.summary,
-                aligned_data=result.aligned_data,
-                metadata=result.comparison_metadata,
-                file_a_path='test_a.xlsx',
-                file_b_path='test_b.xlsx'
-            )
-            
-            # Verify report was created
-            assert Path(report_path).exists()
-            
-            # Verify report content
-            wb = load_workbook(report_path)
-            assert 'Summary' in wb.sheetnames
-            assert 'Aligned Diff' in wb.sheetnames
-            assert 'Legend' in wb.sheetnames
-        
-        finally:
-            if Path(report_path).exists():
-                Path(report_path).unlink()
+        _run(df_a, df_b, config, expected)
     
-    def test_full_workflow_with_multiple_changes(self):
+    def test_full_workflow_with_multiple_changes(self, employee_frames):
         """Test workflow with added, removed, and modified rows"""
-        df_a = pd.DataFrame({
-            'ID': [1, 2, 3, 4],
-            'Name': ['Alice', 'Bob', 'Charlie', 'David'],
-            'Department': ['Sales', 'IT', 'HR', 'Finance'],
-            'Salary': [50000, 60000, 55000, 65000]
-        })
+        df_a, df_b = employee_frames
         
-        df_b = pd.DataFrame({
-            'ID': [1, 2, 3, 5],
-            'Name': ['Alice', 'Bob', 'Charles', 'Eve'],  # Modified Charlie, removed David, added Eve
-            'Department': ['Sales', 'IT', 'HR', 'Operations'],  # Modified HR/Ops
-            'Salary': [52000, 60000, 55000, 70000]  # Multiple salary changes
-        })
-        
-        config = ComparisonConfig(
-            key_columns=['ID'],
-            case_sensitive=False,
-            trim_whitespace=True
-        )
+        config = ComparisonConfig(key_columns=('ID',))
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
         # Verify all types of changes are detected
@@ -113,96 +204,80 @@ class TestEndToEndComparison:
         assert result.summary['modified_count'] > 0
         assert result.summary['keys_only_in_a'] == 1  # David (ID 4)
         assert result.summary['keys_only_in_b'] == 1  # Eve (ID 5)
-        assert len(result.key_only_in_a) == 1
-        assert len(result.key_only_in_b) == 1
+
+
+@pytest.mark.report
+class TestReportOutput:
+    """Test report output for comparison results (needs openpyxl)"""
+    
+    def test_report_sheet_names(self, generated_report):
+        """Test the report writes the expected sheets for a comparison result"""
+        assert generated_report.sheetnames == REPORT_SHEETS
+    
+    def test_report_diff_statuses(self, generated_report, report_result):
+        """Test the Aligned Diff sheet lists every row status in order"""
+        rows = generated_report['Aligned Diff'].iter_rows(values_only=True)
+        header = next(rows)
+        status_idx = header.index('STATUS')
+        
+        statuses = [row[status_idx] for row in rows]
+        assert statuses == report_result.aligned_data['status'].tolist()
+    
+    def test_report_key_values(self, generated_report, report_result):
+        """Test key values, including datetime keys, are written as they were compared"""
+        rows = generated_report['Aligned Diff'].iter_rows(values_only=True)
+        header = next(rows)
+        key_cols = [col for col in report_result.aligned_data.columns if col.startswith('key_')]
+        key_idx = [header.index(col.replace('key_', '').upper()) for col in key_cols]
+        
+        written = [[row[idx] for idx in key_idx] for row in rows]
+        assert written == report_result.aligned_data[key_cols].values.tolist()
 
 
 class TestCompositeKeyWorkflow:
     """Test workflow with composite keys"""
     
-    def test_composite_key_full_workflow(self):
-        """Test end-to-end with composite keys"""
-        df_a = pd.DataFrame({
-            'Account': ['ACC001', 'ACC001', 'ACC002', 'ACC002'],
-            'TransDate': ['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-03'],
-            'Amount': [1000.00, 500.00, 2000.00, 300.00],
-            'Type': ['Deposit', 'Withdrawal', 'Deposit', 'Fee']
-        })
-        
-        df_b = pd.DataFrame({
-            'Account': ['ACC001', 'ACC001', 'ACC002', 'ACC002'],
-            'TransDate': ['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-03'],
-            'Amount': [1000.00, 500.00, 2000.00, 350.00],  # Last amount modified
-            'Type': ['Deposit', 'Withdrawal', 'Deposit', 'Fee']
-        })
+    @pytest.mark.parametrize('n_accounts,n_days', [
+        pytest.param(2, 2, id='4_rows'),
+        pytest.param(100, 100, id='10k_rows', marks=pytest.mark.slow),
+    ])
+    def test_composite_key_scaling(self, n_accounts, n_days):
+        """Test composite-key reconciliation from a few rows up to 10k"""
+        df_a, df_b = _make_txn_frames(n_accounts, n_days, modify_fraction=0.25)
         
         config = ComparisonConfig(
-            key_columns=['Account', 'TransDate'],
+            key_columns=('Account', 'TransDate'),
             alignment_method=AlignmentMethod.POSITION
         )
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
-        # All composite keys should match
-        assert result.summary['keys_in_common'] == 4
-        assert result.summary['modified_count'] == 1
-        
-        # Generate and verify report
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            report_path = f.name
-        
-        try:
-            generator = ReportGenerator(report_path)
-            generator.generate_report(
-                summary=result.summary,
-                aligned_data=result.aligned_data,
-                metadata=result.comparison_metadata,
-                file_a_path='transactions_a.xlsx',
-                file_b_path='transactions_b.xlsx'
-            )
-            
-            assert Path(report_path).exists()
-            wb = load_workbook(report_path)
-            assert 'Summary' in wb.sheetnames
-        
-        finally:
-            if Path(report_path).exists():
-                Path(report_path).unlink()
+        n_rows = n_accounts * n_days
+        assert result.summary['keys_in_common'] == n_rows
+        assert result.summary['modified_count'] == (df_a['Amount'] != df_b['Amount']).sum()
+        assert result.summary['match_count'] == n_rows - result.summary['modified_count']
 
 
 class TestMultiRowPerKeyWorkflow:
     """Test workflow with multiple rows per key"""
     
-    def test_multi_row_key_full_workflow(self):
+    def test_multi_row_key_full_workflow(self, coverage_frames):
         """Test policy with multiple coverages workflow"""
-        df_a = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001', 'P002', 'P002'],
-            'Coverage': ['Basic', 'Standard', 'Premium', 'Basic', 'Standard'],
-            'Premium': [100, 150, 200, 120, 180],
-            'Limit': [100000, 250000, 500000, 100000, 250000]
-        })
-        
-        df_b = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001', 'P002', 'P002', 'P002'],
-            'Coverage': ['Basic', 'Standard', 'Premium', 'Basic', 'Standard', 'Elite'],
-            'Premium': [100, 160, 200, 120, 180, 250],  # Modified one, added one
-            'Limit': [100000, 250000, 500000, 100000, 250000, 600000]
-        })
+        df_a, df_b = coverage_frames
         
         config = ComparisonConfig(
-            key_columns=['Policy'],
+            key_columns=('Policy',),
             alignment_method=AlignmentMethod.POSITION
         )
         
-        engine = ComparisonEngine(config)
-        result = engine.compare(df_a, df_b)
-        
         # Verify multi-row key handling
-        assert result.summary['keys_in_common'] == 2
-        assert result.summary['match_count'] == 4
-        assert result.summary['modified_count'] == 1
-        assert result.summary['added_row_count'] == 1
+        _run(df_a, df_b, config, {
+            'keys_in_common': 2,
+            'match_count': 4,
+            'modified_count': 1,
+            'added_row_count': 1
+        })
 
 
 class TestDataNormalizationIntegration:
@@ -211,23 +286,23 @@ class TestDataNormalizationIntegration:
     def test_case_insensitive_comparison(self):
         """Test case insensitive comparison in full workflow"""
         df_a = pd.DataFrame({
-            'ID': [1, 2],
-            'Status': ['ACTIVE', 'PENDING'],
-            'Notes': ['IMPORTANT', 'REVIEW']
+            'ID': np.array([1, 2], dtype=np.int64),
+            'Status': pd.array(['ACTIVE', 'PENDING'], dtype='string'),
+            'Notes': pd.array(['IMPORTANT', 'REVIEW'], dtype='string')
         })
         
         df_b = pd.DataFrame({
-            'ID': [1, 2],
-            'Status': ['Active', 'Pending'],  # Different case
-            'Notes': ['important', 'review']  # Different case
+            'ID': np.array([1, 2], dtype=np.int64),
+            'Status': pd.array(['Active', 'Pending'], dtype='string'),  # Different case
+            'Notes': pd.array(['important', 'review'], dtype='string')  # Different case
         })
         
         config = ComparisonConfig(
-            key_columns=['ID'],
+            key_columns=('ID',),
             case_sensitive=False
         )
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
         # Should match despite case differences
@@ -237,23 +312,23 @@ class TestDataNormalizationIntegration:
     def test_whitespace_trimming_integration(self):
         """Test whitespace trimming in full workflow"""
         df_a = pd.DataFrame({
-            'ID': [1, 2],
-            'Name': [' Alice ', ' Bob '],
-            'City': [' NYC ', ' LA ']
+            'ID': np.array([1, 2], dtype=np.int64),
+            'Name': pd.array([' Alice ', ' Bob '], dtype='string'),
+            'City': pd.array([' NYC ', ' LA '], dtype='string')
         })
         
         df_b = pd.DataFrame({
-            'ID': [1, 2],
-            'Name': ['Alice', 'Bob'],  # No spaces
-            'City': ['NYC', 'LA']  # No spaces
+            'ID': np.array([1, 2], dtype=np.int64),
+            'Name': pd.array(['Alice', 'Bob'], dtype='string'),  # No spaces
+            'City': pd.array(['NYC', 'LA'], dtype='string')  # No spaces
         })
         
         config = ComparisonConfig(
-            key_columns=['ID'],
+            key_columns=('ID',),
             trim_whitespace=True
         )
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
         # Should match after trimming
@@ -267,23 +342,23 @@ class TestAlignmentMethodsIntegration:
     def test_position_based_alignment_integration(self):
         """Test position-based alignment in workflow"""
         df_a = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001'],
-            'Date': ['2024-01-01', '2024-01-02', '2024-01-03'],
-            'Amount': [100, 200, 300]
+            'Policy': pd.array(['P001', 'P001', 'P001'], dtype='string'),
+            'Date': pd.array(['2024-01-01', '2024-01-02', '2024-01-03'], dtype='string'),
+            'Amount': np.array([100, 200, 300], dtype=np.int64)
         })
         
         df_b = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001'],
-            'Date': ['2024-01-03', '2024-01-01', '2024-01-02'],  # Different order
-            'Amount': [300, 100, 200]
+            'Policy': pd.array(['P001', 'P001', 'P001'], dtype='string'),
+            'Date': pd.array(['2024-01-03', '2024-01-01', '2024-01-02'], dtype='string'),  # Different order
+            'Amount': np.array([300, 100, 200], dtype=np.int64)
         })
         
         config = ComparisonConfig(
-            key_columns=['Policy'],
+            key_columns=('Policy',),
             alignment_method=AlignmentMethod.POSITION
         )
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
         # Position-based: 1st to 1st, 2nd to 2nd, 3rd to 3rd
@@ -293,24 +368,24 @@ class TestAlignmentMethodsIntegration:
     def test_secondary_sort_alignment_integration(self):
         """Test secondary sort alignment in workflow"""
         df_a = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001'],
-            'Date': ['2024-01-03', '2024-01-01', '2024-01-02'],
-            'Amount': [300, 100, 200]
+            'Policy': pd.array(['P001', 'P001', 'P001'], dtype='string'),
+            'Date': pd.array(['2024-01-03', '2024-01-01', '2024-01-02'], dtype='string'),
+            'Amount': np.array([300, 100, 200], dtype=np.int64)
         })
         
         df_b = pd.DataFrame({
-            'Policy': ['P001', 'P001', 'P001'],
-            'Date': ['2024-01-01', '2024-01-02', '2024-01-03'],
-            'Amount': [100, 200, 300]
+            'Policy': pd.array(['P001', 'P001', 'P001'], dtype='string'),
+            'Date': pd.array(['2024-01-01', '2024-01-02', '2024-01-03'], dtype='string'),
+            'Amount': np.array([100, 200, 300], dtype=np.int64)
         })
         
         config = ComparisonConfig(
-            key_columns=['Policy'],
+            key_columns=('Policy',),
             alignment_method=AlignmentMethod.SECONDARY_SORT,
             secondary_sort_column='Date'
         )
         
-        engine = ComparisonEngine(config)
+        engine = _engine_for(config)
         result = engine.compare(df_a, df_b)
         
         # Secondary sort: should align by date, matching all three
@@ -325,8 +400,8 @@ class TestErrorHandling:
         df_a = pd.DataFrame({'ID': [1], 'Value': [100]})
         df_b = pd.DataFrame({'Name': ['Alice'], 'Value': [100]})
         
-        config = ComparisonConfig(key_columns=['ID'])
-        engine = ComparisonEngine(config)
+        config = ComparisonConfig(key_columns=('ID',))
+        engine = _engine_for(config)
         
         with pytest.raises(KeyError):
             engine.compare(df_a, df_b)
@@ -336,126 +411,12 @@ class TestErrorHandling:
         df_a = pd.DataFrame()
         df_b = pd.DataFrame({'ID': [1], 'Value': [100]})
         
-        # Should handle gracefully
-        try:
-            config = ComparisonConfig(key_columns=['ID'])
-            engine = ComparisonEngine(config)
-            # This may raise or handle gracefully depending on implementation
-            result = engine.compare(df_a, df_b)
-        except (KeyError, ValueError):
-            pass  # Expected behavior
-
-
-class TestRealWorldScenarios:
-    """Test real-world business scenarios"""
-    
-    def test_insurance_policy_comparison(self):
-        """Test insurance policy reconciliation scenario"""
-        df_a = pd.DataFrame({
-            'PolicyNumber': ['POL001', 'POL001', 'POL001', 'POL002'],
-            'CoverageType': ['Liability', 'Property', 'Medical', 'Liability'],
-            'Premium': [500.00, 1000.00, 200.00, 600.00],
-            'Limit': [100000, 500000, 10000, 100000],
-            'Effective': ['2024-01-01'] * 4
-        })
-        
-        df_b = pd.DataFrame({
-            'PolicyNumber': ['POL001', 'POL001', 'POL001', 'POL002', 'POL003'],
-            'CoverageType': ['Liability', 'Property', 'Medical', 'Liability', 'Liability'],
-            'Premium': [525.00, 1000.00, 200.00, 600.00, 450.00],  # One modified, one new
-            'Limit': [100000, 500000, 10000, 100000, 75000],
-            'Effective': ['2024-01-01'] * 5
-        })
-        
-        config = ComparisonConfig(
-            key_columns=['PolicyNumber'],
-            case_sensitive=False,
-            trim_whitespace=True
-        )
-        
-        engine = ComparisonEngine(config)
-        result = engine.compare(df_a, df_b)
+        config = ComparisonConfig(key_columns=('ID',))
+        engine = _engine_for(config)
         
-        # POL001 has multiple coverages, POL002 matches, POL003 is new
-        assert result.summary['keys_in_common'] == 2
-        assert result.summary['keys_only_in_b'] == 1
-        assert result.summary['new_key_count'] == 1
-        assert result.summary['modified_count'] >= 1
-    
-    def test_financial_transaction_reconciliation(self):
-        """Test financial transaction reconciliation scenario"""
-        df_a = pd.DataFrame({
-            'Account': ['ACC001', 'ACC001', 'ACC002', 'ACC002'],
-            'Date': ['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-03'],
-            'Type': ['Deposit', 'Withdrawal', 'Deposit', 'Fee'],
-            'Amount': [5000.00, 1000.00, 3000.00, 25.00],
-            'Balance': [5000.00, 4000.00, 3000.00, 2975.00]
-        })
-        
-        df_b = pd.DataFrame({
-            'Account': ['ACC001', 'ACC001', 'ACC002', 'ACC002'],
-            'Date': ['2024-01-01', '2024-01-02', '2024-01-01', '2024-01-03'],
-            'Type': ['Deposit', 'Withdrawal', 'Deposit', 'Fee'],
-            'Amount': [5000.00, 1000.00, 3000.00, 30.00],  # Fee amount different
-            'Balance': [5000.00, 4000.00, 3000.00, 2970.00]  # Balance different
-        })
-        
-        config = ComparisonConfig(
-            key_columns=['Account', 'Date'],
-            alignment_method=AlignmentMethod.POSITION
-        )
-        
-        engine = ComparisonEngine(config)
-        result = engine.compare(df_a, df_b)
-        
-        # One transaction should show as modified
-        assert result.summary['modified_count'] == 1
-        assert result.summary['keys_in_common'] == 4
-
-
-class TestReportIntegration:
-    """Test report generation integration"""
-    
-    def test_report_contains_all_comparison_data(self):
-        """Test that report contains all comparison data"""
-        df_a = pd.DataFrame({
-            'ID': [1, 2, 3],
-            'Name': ['Alice', 'Bob', 'Charlie'],
-            'Value': [100, 200, 300]
-        })
-        
-        df_b = pd.DataFrame({
-            'ID': [1, 2, 4],
-            'Name': ['Alice', 'Robert', 'Diana'],
-            'Value': [100, 250, 400]
-        })
-        
-        config = ComparisonConfig(key_columns=['ID'])
-        engine = ComparisonEngine(config)
-        result = engine.compare(df_a, df_b)
-        
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            report_path = f.name
-        
-        try:
-            generator = ReportGenerator(report_path)
-            generator.generate_report(
-                summary=result.summary,
-                aligned_data=result.aligned_data,
-                metadata=result.comparison_metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            wb = load_workbook(report_path)
-            summary_sheet = wb['Summary']
-            
-            # Verify summary sheet contains key statistics
-            assert summary_sheet is not None
-        
-        finally:
-            if Path(report_path).exists():
-                Path(report_path).unlink()
+        # A frame without the key column is rejected up front
+        with pytest.raises((KeyError, ValueError)):
+            engine.compare(df_a, df_b)
 
 
 if __name__ == '__main__':
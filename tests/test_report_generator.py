@@ -3,130 +3,161 @@ Unit tests for report_generator module
 Tests Excel report generation functionality
 """
 
+import io
+import re
+import zipfile
 import pytest
 import pandas as pd
-import tempfile
 from pathlib import Path
+from uuid import uuid4
+
+openpyxl = pytest.importorskip("openpyxl")
+
 from openpyxl import load_workbook
 from src.reports.report_generator import ReportGenerator
 from src.core import RowStatus
 
 
+pytestmark = pytest.mark.report
+
+# Status columns are categorical over every RowStatus value
+STATUS_DTYPE = pd.CategoricalDtype([status.value for status in RowStatus])
+
+
+def _sheet_names(xlsx):
+    """Read sheet names from xl/workbook.xml without parsing the whole workbook"""
+    with zipfile.ZipFile(xlsx) as archive:
+        workbook_xml = archive.read('xl/workbook.xml').decode('utf-8')
+    return re.findall(r'<sheet [^>]*name="([^"]+)"', workbook_xml)
+
+
+@pytest.fixture
+def report_gen_factory(tmp_path):
+    """Return a callable that creates a ReportGenerator writing a fresh file under tmp_path"""
+    def make():
+        return ReportGenerator(tmp_path / f"report_{uuid4().hex}.xlsx")
+    return make
+
+
+# Shared read-only inputs; tests that need to change them should copy first
+
+@pytest.fixture(scope="module")
+def basic_summary():
+    """Summary for a single key with one matching row"""
+    return {
+        'total_unique_keys_a': 1,
+        'total_unique_keys_b': 1,
+        'keys_in_common': 1,
+        'keys_only_in_a': 0,
+        'keys_only_in_b': 0,
+        'total_rows_compared': 1,
+        'match_count': 1,
+        'modified_count': 0,
+        'added_row_count': 0,
+        'removed_row_count': 0,
+        'new_key_count': 0,
+        'removed_key_count': 0,
+    }
+
+
+@pytest.fixture(scope="module")
+def single_row_aligned():
+    """Aligned data with one matching row"""
+    return pd.DataFrame({
+        'key_ID': [1],
+        'A_Value': [100],
+        'status': pd.Categorical([RowStatus.MATCH.value], dtype=STATUS_DTYPE),
+        'B_Value': [100]
+    })
+
+
 class TestReportGeneratorBasic:
     """Test basic report generation functionality"""
     
-    def test_report_generator_creation(self):
+    def test_report_generator_creation(self, tmp_path):
         """Test creating a report generator"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            generator = ReportGenerator(f.name)
-            assert generator.output_path.name.endswith('.xlsx')
+        generator = ReportGenerator(tmp_path / "report.xlsx")
+        assert generator.output_path.name.endswith('.xlsx')
     
-    def test_report_generation_empty_data(self):
+    def test_report_generation_empty_data(self, report_gen_factory, basic_summary):
         """Test generating report with empty data"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 0,
-                'total_unique_keys_b': 0,
-                'keys_in_common': 0,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 0,
-                'match_count': 0,
-                'modified_count': 0,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame()
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            assert Path(output_path).exists()
-            
-            # Verify workbook structure
-            wb = load_workbook(output_path)
-            assert 'Summary' in wb.sheetnames
-            assert 'Legend' in wb.sheetnames
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = dict.fromkeys(basic_summary, 0)
+        
+        aligned_data = pd.DataFrame()
+        metadata = {'config': None}
+        
+        report = generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert Path(output_path).exists()
+        
+        # Verify workbook structure
+        assert 'Summary' in report['sheet_names']
+        assert 'Legend' in report['sheet_names']
     
-    def test_summary_sheet_created(self):
+    def test_summary_sheet_created(self, report_gen_factory):
         """Test that summary sheet is created with correct data"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 10,
-                'total_unique_keys_b': 12,
-                'keys_in_common': 9,
-                'keys_only_in_a': 1,
-                'keys_only_in_b': 3,
-                'total_rows_compared': 25,
-                'match_count': 20,
-                'modified_count': 3,
-                'added_row_count': 1,
-                'removed_row_count': 1,
-                'new_key_count': 2,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1, 2, 3],
-                'A_Value': [100, 200, 300],
-                'status': [RowStatus.MATCH.value, RowStatus.MODIFIED.value, RowStatus.ADDED_ROW.value],
-                'B_Value': [100, 250, 300]
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='C:\\data\\file_a.xlsx',
-                file_b_path='C:\\data\\file_b.xlsx'
-            )
-            
-            # Verify workbook
-            wb = load_workbook(output_path)
-            assert 'Summary' in wb.sheetnames
-            
-            summary_sheet = wb['Summary']
-            # Check that file paths are in summary
-            assert summary_sheet['B4'].value == 'C:\\data\\file_a.xlsx'
-            assert summary_sheet['B5'].value == 'C:\\data\\file_b.xlsx'
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = {
+            'total_unique_keys_a': 10,
+            'total_unique_keys_b': 12,
+            'keys_in_common': 9,
+            'keys_only_in_a': 1,
+            'keys_only_in_b': 3,
+            'total_rows_compared': 25,
+            'match_count': 20,
+            'modified_count': 3,
+            'added_row_count': 1,
+            'removed_row_count': 1,
+            'new_key_count': 2,
+            'removed_key_count': 0,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2, 3],
+            'A_Value': [100, 200, 300],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MODIFIED.value,
+                                      RowStatus.ADDED_ROW.value], dtype=STATUS_DTYPE),
+            'B_Value': [100, 250, 300]
+        })
+        
+        metadata = {'config': None}
+        
+        generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='C:\\data\\file_a.xlsx',
+            file_b_path='C:\\data\\file_b.xlsx'
+        )
+        
+        # Verify workbook
+        wb = load_workbook(output_path, read_only=True, data_only=True)
+        assert 'Summary' in wb.sheetnames
+        
+        summary_sheet = wb['Summary']
+        # Check that file paths are in summary
+        assert summary_sheet['B4'].value == 'C:\\data\\file_a.xlsx'
+        assert summary_sheet['B5'].value == 'C:\\data\\file_b.xlsx'
+        wb.close()
 
 
 class TestReportColorCoding:
     """Test color coding in report"""
     
-    def test_color_constants_defined(self):
+    def test_color_constants_defined(self, tmp_path):
         """Test that color constants are defined"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            generator = ReportGenerator(f.name)
+        generator = ReportGenerator(tmp_path / "report.xlsx")
         
         assert 'MATCH' in generator.COLORS
         assert 'MODIFIED' in generator.COLORS
@@ -135,402 +166,494 @@ class TestReportColorCoding:
         assert 'NEW_KEY' in generator.COLORS
         assert 'REMOVED_KEY' in generator.COLORS
         assert 'HEADER' in generator.COLORS
-        
-        Path(f.name).unlink()
     
-    def test_color_values_valid_hex(self):
+    def test_color_values_valid_hex(self, tmp_path):
         """Test that color values are valid hex codes"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            generator = ReportGenerator(f.name)
+        generator = ReportGenerator(tmp_path / "report.xlsx")
         
         for status, color in generator.COLORS.items():
             # Should be 6-character hex code
             assert len(color) == 6
             assert all(c in '0123456789ABCDEF' for c in color.upper())
+    
+    def test_written_cell_styles(self, report_gen_factory, basic_summary):
+        """Test fonts, fills, alignment, borders and date formats survive the style cache"""
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2],
+            'A_When': pd.to_datetime(['2024-01-01', '2024-01-02']),
+            'A_Value': [100, 200],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MODIFIED.value],
+                                     dtype=STATUS_DTYPE),
+            'B_When': pd.to_datetime(['2024-01-01', '2024-01-02']),
+            'B_Value': [100, 250]
+        })
+        generator = report_gen_factory()
+        generator.generate_report(
+            summary=basic_summary,
+            aligned_data=aligned_data,
+            metadata={'config': None},
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        ws = load_workbook(generator.output_path)['Aligned Diff']
+        colors = ReportGenerator.COLORS
+        
+        header = ws['D1']
+        assert header.value == 'STATUS'
+        assert header.font.bold and header.font.color.rgb.endswith('FFFFFF')
+        assert header.fill.fgColor.rgb.endswith(colors['HEADER'])
+        assert header.alignment.horizontal == 'center'
         
-        Path(f.name).unlink()
+        # Both status cells share font/alignment/border but not the fill
+        for cell, status in ((ws['D2'], 'MATCH'), (ws['D3'], 'MODIFIED')):
+            assert cell.value == status
+            assert cell.font.bold
+            assert cell.fill.fgColor.rgb.endswith(colors[status])
+            assert cell.alignment.horizontal == 'center'
+            assert cell.border.left.style == 'thin'
+        
+        # New key groups are bold on the separator fill
+        assert ws['A3'].font.bold
+        assert ws['A3'].fill.fgColor.rgb.endswith(colors['KEY_SEPARATOR'])
+        # Only the changed File B cell is highlighted
+        assert ws['F3'].fill.fgColor.rgb.endswith(colors['MODIFIED'])
+        assert ws['E3'].fill.fill_type is None
+        # Dates written through a cached style keep their number format
+        assert ws['B3'].is_date and ws['E3'].is_date
 
 
 class TestReportStructure:
     """Test report sheet structure"""
     
-    def test_multiple_sheets_created(self):
+    def test_multiple_sheets_created(self, report_gen_factory):
         """Test that multiple sheets are created"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 5,
-                'total_unique_keys_b': 5,
-                'keys_in_common': 5,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 5,
-                'match_count': 5,
-                'modified_count': 0,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1, 2, 3, 4, 5],
-                'A_Value': [100, 200, 300, 400, 500],
-                'status': [RowStatus.MATCH.value] * 5,
-                'B_Value': [100, 200, 300, 400, 500]
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            # Verify sheets exist
-            wb = load_workbook(output_path)
-            expected_sheets = ['Summary', 'Aligned Diff', 'Legend']
-            for sheet in expected_sheets:
-                assert sheet in wb.sheetnames
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = {
+            'total_unique_keys_a': 5,
+            'total_unique_keys_b': 5,
+            'keys_in_common': 5,
+            'keys_only_in_a': 0,
+            'keys_only_in_b': 0,
+            'total_rows_compared': 5,
+            'match_count': 5,
+            'modified_count': 0,
+            'added_row_count': 0,
+            'removed_row_count': 0,
+            'new_key_count': 0,
+            'removed_key_count': 0,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2, 3, 4, 5],
+            'A_Value': [100, 200, 300, 400, 500],
+            'status': pd.Categorical([RowStatus.MATCH.value] * 5, dtype=STATUS_DTYPE),
+            'B_Value': [100, 200, 300, 400, 500]
+        })
+        
+        metadata = {'config': None}
+        
+        report = generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        # Verify sheets exist
+        assert report['path'] == Path(output_path)
+        assert report['sheet_names'] == ['Summary', 'Aligned Diff', 'Legend']
     
-    def test_legend_sheet_content(self):
+    def test_legend_sheet_content(self, report_gen_factory, basic_summary, single_row_aligned):
         """Test that legend sheet contains explanation"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 1,
-                'total_unique_keys_b': 1,
-                'keys_in_common': 1,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 1,
-                'match_count': 1,
-                'modified_count': 0,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1],
-                'A_Value': [100],
-                'status': [RowStatus.MATCH.value],
-                'B_Value': [100]
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            wb = load_workbook(output_path)
-            legend_sheet = wb['Legend']
-            assert legend_sheet is not None
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        metadata = {'config': None}
+        
+        generator.generate_report(
+            summary=basic_summary,
+            aligned_data=single_row_aligned,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert 'Legend' in _sheet_names(output_path)
 
 
 class TestReportWithVariousStatuses:
     """Test report generation with various row statuses"""
     
-    def test_report_with_all_statuses(self):
+    def test_report_with_all_statuses(self, report_gen_factory):
         """Test report with all row status types"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 7,
-                'total_unique_keys_b': 7,
-                'keys_in_common': 5,
-                'keys_only_in_a': 2,
-                'keys_only_in_b': 2,
-                'total_rows_compared': 10,
-                'match_count': 3,
-                'modified_count': 2,
-                'added_row_count': 1,
-                'removed_row_count': 1,
-                'new_key_count': 2,
-                'removed_key_count': 2,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
-                'A_Value': [100, 200, 300, 400, 500, 600, 700, None, None, None],
-                'status': [
-                    RowStatus.MATCH.value,
-                    RowStatus.MATCH.value,
-                    RowStatus.MATCH.value,
-                    RowStatus.MODIFIED.value,
-                    RowStatus.MODIFIED.value,
-                    RowStatus.ADDED_ROW.value,
-                    RowStatus.REMOVED_ROW.value,
-                    RowStatus.NEW_KEY.value,
-                    RowStatus.NEW_KEY.value,
-                    RowStatus.REMOVED_KEY.value
-                ],
-                'B_Value': [100, 200, 300, 450, 550, 800, None, 900, 1000, None]
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            assert Path(output_path).exists()
-            wb = load_workbook(output_path)
-            assert 'Aligned Diff' in wb.sheetnames
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = {
+            'total_unique_keys_a': 7,
+            'total_unique_keys_b': 7,
+            'keys_in_common': 5,
+            'keys_only_in_a': 2,
+            'keys_only_in_b': 2,
+            'total_rows_compared': 10,
+            'match_count': 3,
+            'modified_count': 2,
+            'added_row_count': 1,
+            'removed_row_count': 1,
+            'new_key_count': 2,
+            'removed_key_count': 2,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+            'A_Value': [100, 200, 300, 400, 500, 600, 700, None, None, None],
+            'status': pd.Categorical([
+                RowStatus.MATCH.value,
+                RowStatus.MATCH.value,
+                RowStatus.MATCH.value,
+                RowStatus.MODIFIED.value,
+                RowStatus.MODIFIED.value,
+                RowStatus.ADDED_ROW.value,
+                RowStatus.REMOVED_ROW.value,
+                RowStatus.NEW_KEY.value,
+                RowStatus.NEW_KEY.value,
+                RowStatus.REMOVED_KEY.value
+            ], dtype=STATUS_DTYPE),
+            'B_Value': [100, 200, 300, 450, 550, 800, None, 900, 1000, None]
+        })
+        
+        metadata = {'config': None}
+        
+        report = generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert Path(output_path).exists()
+        assert 'Aligned Diff' in report['sheet_names']
     
-    def test_report_with_modified_rows(self):
+    def test_report_with_modified_rows(self, report_gen_factory):
         """Test report highlighting modified rows"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 3,
-                'total_unique_keys_b': 3,
-                'keys_in_common': 3,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 3,
-                'match_count': 1,
-                'modified_count': 2,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1, 2, 3],
-                'A_Name': ['Alice', 'Bob', 'Charlie'],
-                'A_Value': [100, 200, 300],
-                'status': [RowStatus.MATCH.value, RowStatus.MODIFIED.value, RowStatus.MODIFIED.value],
-                'B_Name': ['Alice', 'Bobby', 'Charles'],
-                'B_Value': [100, 220, 320],
-                'changed_cells': ['', 'Name, Value', 'Name, Value']
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            assert Path(output_path).exists()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = {
+            'total_unique_keys_a': 3,
+            'total_unique_keys_b': 3,
+            'keys_in_common': 3,
+            'keys_only_in_a': 0,
+            'keys_only_in_b': 0,
+            'total_rows_compared': 3,
+            'match_count': 1,
+            'modified_count': 2,
+            'added_row_count': 0,
+            'removed_row_count': 0,
+            'new_key_count': 0,
+            'removed_key_count': 0,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2, 3],
+            'A_Name': ['Alice', 'Bob', 'Charlie'],
+            'A_Value': [100, 200, 300],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MODIFIED.value,
+                                      RowStatus.MODIFIED.value], dtype=STATUS_DTYPE),
+            'B_Name': ['Alice', 'Bobby', 'Charles'],
+            'B_Value': [100, 220, 320],
+            'changed_cells': ['', 'Name, Value', 'Name, Value']
+        })
         
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        metadata = {'config': None}
+        
+        generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert Path(output_path).exists()
 
 
 class TestReportSaving:
     """Test report file saving"""
     
-    def test_report_file_saved_successfully(self):
+    def test_report_file_saved_successfully(self, report_gen_factory, basic_summary, single_row_aligned):
         """Test that report file is saved successfully"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 1,
-                'total_unique_keys_b': 1,
-                'keys_in_common': 1,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 1,
-                'match_count': 1,
-                'modified_count': 0,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1],
-                'A_Value': [100],
-                'status': [RowStatus.MATCH.value],
-                'B_Value': [100]
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            # Check file exists and is readable
-            assert Path(output_path).exists()
-            assert Path(output_path).stat().st_size > 0
-            
-            # Verify it's a valid Excel file
-            wb = load_workbook(output_path)
-            assert len(wb.sheetnames) >= 2
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        metadata = {'config': None}
+        
+        generator.generate_report(
+            summary=basic_summary,
+            aligned_data=single_row_aligned,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        # Check file exists and is readable
+        assert Path(output_path).exists()
+        assert Path(output_path).stat().st_size > 0
+        
+        # Verify it's a valid Excel file
+        wb = load_workbook(output_path, read_only=True, data_only=True)
+        assert len(wb.sheetnames) >= 2
+        wb.close()
     
-    def test_report_timestamp_in_path(self):
+    def test_report_saved_to_buffer(self, basic_summary, single_row_aligned, capsys):
+        """Test that a report can be written to an in-memory buffer"""
+        buffer = io.BytesIO()
+        generator = ReportGenerator(buffer)
+        
+        report = generator.generate_report(
+            summary=basic_summary,
+            aligned_data=single_row_aligned,
+            metadata={'config': None},
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert report['path'] is buffer
+        assert _sheet_names(buffer) == report['sheet_names']
+        # No "Report generated" line with a buffer's repr
+        assert capsys.readouterr().out == ''
+    
+    def test_report_timestamp_in_path(self, tmp_path):
         """Test that report can use timestamp in path"""
         timestamp = '20240101_120000'
-        output_path = f'test_report_{timestamp}.xlsx'
-        
-        try:
-            generator = ReportGenerator(output_path)
-            assert timestamp in str(generator.output_path)
+        output_path = tmp_path / f'test_report_{timestamp}.xlsx'
         
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = ReportGenerator(output_path)
+        assert timestamp in str(generator.output_path)
+    
+    def test_lxml_serializer_used_when_installed(self):
+        """Test that openpyxl streams the report through lxml when it is available"""
+        pytest.importorskip("lxml")
+        # False here means lxml is too old or OPENPYXL_LXML=False is set
+        assert openpyxl.LXML, "lxml is installed but openpyxl is not using it"
 
 
 class TestReportEdgeCases:
     """Test edge cases in report generation"""
     
-    def test_report_with_unicode_characters(self):
+    def test_report_with_unicode_characters(self, report_gen_factory):
         """Test report with unicode characters"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            summary = {
-                'total_unique_keys_a': 2,
-                'total_unique_keys_b': 2,
-                'keys_in_common': 2,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': 2,
-                'match_count': 2,
-                'modified_count': 0,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': [1, 2],
-                'A_Name': ['José', 'François'],
-                'status': [RowStatus.MATCH.value, RowStatus.MATCH.value],
-                'B_Name': ['José', 'François']
-            })
-            
-            metadata = {'config': None}
-            
-            generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
-                file_a_path='file_a.xlsx',
-                file_b_path='file_b.xlsx'
-            )
-            
-            assert Path(output_path).exists()
-            wb = load_workbook(output_path)
-            assert 'Summary' in wb.sheetnames
-        
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        summary = {
+            'total_unique_keys_a': 2,
+            'total_unique_keys_b': 2,
+            'keys_in_common': 2,
+            'keys_only_in_a': 0,
+            'keys_only_in_b': 0,
+            'total_rows_compared': 2,
+            'match_count': 2,
+            'modified_count': 0,
+            'added_row_count': 0,
+            'removed_row_count': 0,
+            'new_key_count': 0,
+            'removed_key_count': 0,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 2],
+            'A_Name': ['José', 'François'],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MATCH.value], dtype=STATUS_DTYPE),
+            'B_Name': ['José', 'François']
+        })
+        
+        metadata = {'config': None}
+        
+        report = generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert Path(output_path).exists()
+        assert 'Summary' in report['sheet_names']
     
-    def test_report_with_large_dataset(self):
+    def test_report_with_missing_key(self, basic_summary):
+        """Test a missing key value (pd.NA) is written as an empty cell"""
+        aligned_data = pd.DataFrame({
+            'key_Account': pd.array(['ACC1', None], dtype='string'),
+            'A_Value': [100, 200],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.REMOVED_KEY.value],
+                                     dtype=STATUS_DTYPE),
+            'B_Value': [100, None]
+        })
+        
+        buffer = io.BytesIO()
+        ReportGenerator(buffer).generate_report(
+            summary=basic_summary,
+            aligned_data=aligned_data,
+            metadata={'config': None},
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        buffer.seek(0)
+        wb = load_workbook(buffer, read_only=True)
+        keys = [row[0] for row in wb['Aligned Diff'].iter_rows(min_row=2, values_only=True)]
+        wb.close()
+        assert keys == ['ACC1', None]
+    
+    def test_report_with_large_dataset(self, report_gen_factory):
         """Test report generation with large dataset"""
-        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as f:
-            output_path = f.name
-        
-        try:
-            generator = ReportGenerator(output_path)
-            
-            n = 500
-            summary = {
-                'total_unique_keys_a': n,
-                'total_unique_keys_b': n,
-                'keys_in_common': n,
-                'keys_only_in_a': 0,
-                'keys_only_in_b': 0,
-                'total_rows_compared': n,
-                'match_count': n - 10,
-                'modified_count': 10,
-                'added_row_count': 0,
-                'removed_row_count': 0,
-                'new_key_count': 0,
-                'removed_key_count': 0,
-            }
-            
-            aligned_data = pd.DataFrame({
-                'key_ID': list(range(n)),
-                'A_Value': list(range(100, 100 + n)),
-                'status': [RowStatus.MATCH.value] * (n - 10) + [RowStatus.MODIFIED.value] * 10,
-                'B_Value': list(range(100, 100 + n))
-            })
-            
-            metadata = {'config': None}
-            
+        generator = report_gen_factory()
+        output_path = generator.output_path
+        
+        n = 500
+        summary = {
+            'total_unique_keys_a': n,
+            'total_unique_keys_b': n,
+            'keys_in_common': n,
+            'keys_only_in_a': 0,
+            'keys_only_in_b': 0,
+            'total_rows_compared': n,
+            'match_count': n - 10,
+            'modified_count': 10,
+            'added_row_count': 0,
+            'removed_row_count': 0,
+            'new_key_count': 0,
+            'removed_key_count': 0,
+        }
+        
+        aligned_data = pd.DataFrame({
+            'key_ID': list(range(n)),
+            'A_Value': list(range(100, 100 + n)),
+            'status': pd.Categorical([RowStatus.MATCH.value] * (n - 10) + [RowStatus.MODIFIED.value] * 10, dtype=STATUS_DTYPE),
+            'B_Value': list(range(100, 100 + n))
+        })
+        
+        metadata = {'config': None}
+        
+        generator.generate_report(
+            summary=summary,
+            aligned_data=aligned_data,
+            metadata=metadata,
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert Path(output_path).exists()
+    
+    def test_report_with_chunked_data(self):
+        """Test chunked aligned data produces the same diff sheet as one DataFrame"""
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 1, 2, 2, 3],
+            'A_Value': [100, 110, 200, 210, 300],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MODIFIED.value,
+                                      RowStatus.MATCH.value, RowStatus.REMOVED_ROW.value,
+                                      RowStatus.MATCH.value], dtype=STATUS_DTYPE),
+            'B_Value': [100, 115, 200, None, 300]
+        })
+        
+        def diff_rows(data, chunk_rows):
+            buffer = io.BytesIO()
+            generator = ReportGenerator(buffer)
+            generator.CHUNK_ROWS = chunk_rows
             generator.generate_report(
-                summary=summary,
-                aligned_data=aligned_data,
-                metadata=metadata,
+                summary={},
+                aligned_data=data,
+                metadata={'config': None},
                 file_a_path='file_a.xlsx',
                 file_b_path='file_b.xlsx'
             )
-            
-            assert Path(output_path).exists()
+            buffer.seek(0)
+            wb = load_workbook(buffer, read_only=True, data_only=True)
+            rows = [[(cell.value, cell.fill.fgColor.rgb) for cell in row]
+                    for row in wb['Aligned Diff'].iter_rows()]
+            wb.close()
+            return rows
+        
+        expected = diff_rows(aligned_data, chunk_rows=10)
+        # Chunk boundaries fall inside key groups
+        assert diff_rows(aligned_data, chunk_rows=3) == expected
+        assert diff_rows(
+            [aligned_data.iloc[:1], aligned_data.iloc[1:4], aligned_data.iloc[4:]],
+            chunk_rows=10
+        ) == expected
+        # Empty chunks, leading or in between, are skipped
+        assert diff_rows(
+            [aligned_data.iloc[:0], aligned_data.iloc[:2], aligned_data.iloc[:0], aligned_data.iloc[2:]],
+            chunk_rows=10
+        ) == expected
+
+
+class TestReportBulkCsv:
+    """Test writing aligned rows to CSV with bulk_format='csv'"""
+    
+    @pytest.mark.parametrize("chunked", [False, True], ids=["frame", "chunks"])
+    def test_csv_bulk_format_writes_aligned_rows(self, tmp_path, basic_summary, chunked):
+        """Test aligned rows go to a CSV beside the report, not into the workbook"""
+        aligned_data = pd.DataFrame({
+            'key_ID': [1, 1, 2],
+            'A_Value': [100, 110, 200],
+            'status': pd.Categorical([RowStatus.MATCH.value, RowStatus.MODIFIED.value,
+                                      RowStatus.NEW_KEY.value], dtype=STATUS_DTYPE),
+            'B_Value': [100, 115, 250]
+        })
+        data = [aligned_data.iloc[:2], aligned_data.iloc[2:]] if chunked else aligned_data
         
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        generator = ReportGenerator(tmp_path / "report.xlsx", bulk_format='csv')
+        report = generator.generate_report(
+            summary=basic_summary,
+            aligned_data=data,
+            metadata={'config': None},
+            file_a_path='file_a.xlsx',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert report['aligned_data_path'] == tmp_path / "report_aligned.csv"
+        assert _sheet_names(report['path']) == ['Summary', 'Aligned Diff', 'Legend']
+        written = pd.read_csv(report['aligned_data_path'])
+        pd.testing.assert_frame_equal(written, aligned_data.astype({'status': str}))
+    
+    def test_invalid_bulk_format_rejected(self, tmp_path):
+        """Test that an unknown bulk_format raises ValueError"""
+        with pytest.raises(ValueError, match="bulk_format"):
+            ReportGenerator(tmp_path / "report.xlsx", bulk_format='parquet')
+    
+    @pytest.mark.parametrize("name", ["report.csv", "report.xls", "report"])
+    def test_csv_bulk_format_needs_xlsx_path(self, tmp_path, name):
+        """Test that bulk_format='csv' refuses report paths the CSV could collide with"""
+        with pytest.raises(ValueError, match=r"\.xlsx report path"):
+            ReportGenerator(tmp_path / name, bulk_format='csv')
+    
+    def test_csv_bulk_format_keeps_existing_csv(self, tmp_path, basic_summary, single_row_aligned):
+        """Test that a CSV already named like the report is not overwritten"""
+        existing = tmp_path / "report.csv"
+        existing.write_text("ID,Value\n1,100\n")
+        
+        report = ReportGenerator(tmp_path / "report.xlsx", bulk_format='csv').generate_report(
+            summary=basic_summary,
+            aligned_data=single_row_aligned,
+            metadata={'config': None},
+            file_a_path='report.csv',
+            file_b_path='file_b.xlsx'
+        )
+        
+        assert report['aligned_data_path'] != existing
+        assert existing.read_text() == "ID,Value\n1,100\n"
+    
+    def test_csv_bulk_format_needs_file_path(self):
+        """Test that bulk_format='csv' refuses a buffer output"""
+        with pytest.raises(ValueError, match="file path"):
+            ReportGenerator(io.BytesIO(), bulk_format='csv')
 
 
 if __name__ == '__main__':
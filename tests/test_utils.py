@@ -2,30 +2,37 @@
 Test utilities and helper functions
 """
 
+import pytest
 import pandas as pd
 import numpy as np
 from typing import Dict, Any
 from src.core import RowStatus
 
 
+_STATUS_LIST = [status.value for status in RowStatus]
+_VALID_STATUSES = frozenset(_STATUS_LIST)
+
+
 class TestDataGenerator:
     """Helper class for generating test data"""
     
     @staticmethod
-    def create_simple_dataframe(n_rows: int = 10) -> pd.DataFrame:
+    def create_simple_dataframe(n_rows: int = 10, seed: int = 0) -> pd.DataFrame:
         """
         Create a simple test DataFrame
         
         Args:
             n_rows: Number of rows to generate
+            seed: Seed for the generated values, so equal arguments give equal frames
             
         Returns:
             DataFrame with ID, Name, and Value columns
         """
+        rng = np.random.default_rng(seed)
         return pd.DataFrame({
             'ID': range(1, n_rows + 1),
             'Name': [f'Person_{i}' for i in range(1, n_rows + 1)],
-            'Value': np.random.randint(100, 1000, n_rows)
+            'Value': rng.integers(100, 1000, n_rows)
         })
     
     @staticmethod
@@ -69,22 +76,24 @@ class TestDataGenerator:
         return pd.DataFrame(rows)
     
     @staticmethod
-    def create_transaction_dataframe(n_transactions: int = 10) -> pd.DataFrame:
+    def create_transaction_dataframe(n_transactions: int = 10, seed: int = 0) -> pd.DataFrame:
         """
         Create a DataFrame with transaction data
         
         Args:
             n_transactions: Number of transactions to create
+            seed: Seed for the generated amounts and types
             
         Returns:
             DataFrame with transaction structure
         """
+        rng = np.random.default_rng(seed)
         return pd.DataFrame({
             'TransactionID': range(1, n_transactions + 1),
             'Account': [f'ACC{(i % 3) + 1:03d}' for i in range(n_transactions)],
             'Date': pd.date_range('2024-01-01', periods=n_transactions),
-            'Amount': np.random.uniform(10, 10000, n_transactions),
-            'Type': np.random.choice(['Deposit', 'Withdrawal', 'Fee'], n_transactions)
+            'Amount': rng.uniform(10, 10000, n_transactions),
+            'Type': rng.choice(['Deposit', 'Withdrawal', 'Fee'], n_transactions)
         })
 
 
@@ -132,8 +141,15 @@ class TestResultValidator:
         if 'status' not in aligned_data.columns:
             return False
         
-        valid_statuses = [status.value for status in RowStatus]
-        return all(status in valid_statuses for status in aligned_data['status'])
+        statuses = aligned_data['status']
+        # Categorical columns only need the categories their rows use checked;
+        # a missing value (code -1) is invalid, as in the object path
+        if isinstance(statuses.dtype, pd.CategoricalDtype):
+            codes = statuses.cat.codes.to_numpy()
+            if (codes < 0).any():
+                return False
+            return _VALID_STATUSES.issuperset(statuses.cat.categories[np.unique(codes)])
+        return bool(statuses.isin(_VALID_STATUSES).all())
     
     @staticmethod
     def count_rows_by_status(aligned_data: pd.DataFrame) -> Dict[str, int]:
@@ -183,6 +199,41 @@ class TestFileGenerator:
         TestFileGenerator.save_test_excel(df_b, file_b_path, 'Data')
 
 
+class TestStatusHelpers:
+    """Test the status helpers of TestResultValidator"""
+    
+    @pytest.mark.parametrize('as_category', [False, True], ids=['object', 'category'])
+    def test_count_rows_by_status(self, as_category):
+        """Test status counts for object and categorical status columns"""
+        statuses = pd.Series(['MATCH', 'MODIFIED', 'MATCH', 'CUSTOM'])
+        expected = {'MATCH': 2, 'MODIFIED': 1, 'CUSTOM': 1}
+        if as_category:
+            statuses = statuses.astype(pd.CategoricalDtype(_STATUS_LIST + ['CUSTOM']))
+            # Unused categories are reported with a count of 0
+            expected.update({status: 0 for status in _STATUS_LIST if status not in expected})
+        
+        counts = TestResultValidator.count_rows_by_status(pd.DataFrame({'status': statuses}))
+        
+        assert counts == expected
+    
+    @pytest.mark.parametrize('as_category', [False, True], ids=['object', 'category'])
+    @pytest.mark.parametrize('values,valid', [
+        (['MATCH', 'NEW_KEY'], True),
+        (['MATCH', 'CUSTOM'], False),
+        (['MATCH', None], False),
+    ])
+    def test_validate_row_status_values(self, as_category, values, valid):
+        """Test status validation for object and categorical status columns"""
+        statuses = pd.Series(values, dtype=object)
+        if as_category:
+            # An unused invalid category does not make the rows invalid
+            statuses = statuses.astype(pd.CategoricalDtype(_STATUS_LIST + ['CUSTOM', 'UNUSED']))
+        
+        aligned_data = pd.DataFrame({'status': statuses})
+        
+        assert TestResultValidator.validate_row_status_values(aligned_data) is valid
+
+
 if __name__ == '__main__':
     # Example usage
     generator = TestDataGenerator()